@@ -1,20 +1,28 @@
 """Main CLI entry point for running the annotation pipeline."""
 
 import asyncio
+from collections.abc import Coroutine
+from typing import Any
 
 import click
 from structlog import get_logger
 
-from metta_nl_corpus.lib.pipeline_config import DatasetConfig, PipelineRunConfig
-from metta_nl_corpus.services.pipeline_executor import (
-    ExecutionResult,
-    ExecutionStatus,
-    PipelineExecutor,
-)
+# Pipeline modules pull in Dagster, Polars, Pandera and hyperon transitively,
+# so they are imported inside the commands that need them. This keeps
+# `--help` and the lightweight commands from paying that import cost.
 
 logger = get_logger(__name__)
 
 
+def _run_async[T](main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on uvloop when the optional extra is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
 @click.group()
 def cli():
     """MeTTa NL Corpus pipeline management CLI."""
@@ -64,6 +72,29 @@ def cli():
     default="openai:gpt-5-nano",
     help="Model to use for annotation generation",
 )
+@click.option(
+    "--max-concurrent-annotations",
+    default=8,
+    type=int,
+    help="Generation requests in flight at once (match OLLAMA_NUM_PARALLEL)",
+)
+@click.option(
+    "--annotation-candidates",
+    default=1,
+    type=int,
+    help="Concurrent generations per pair; the first that validates is kept",
+)
+@click.option(
+    "--export-parquet/--no-export-parquet",
+    default=True,
+    help="Rewrite the parquet snapshot after the run (rows always go to SQLite)",
+)
+@click.option(
+    "--max-output-tokens",
+    default=None,
+    type=int,
+    help="Cap tokens per model response (includes reasoning tokens on o-series/gpt-5)",
+)
 def run(
     hf_id: str,
     filename: str,
@@ -73,9 +104,13 @@ def run(
     subset_size: int,
     batch_size: int,
     annotation_model: str,
+    max_concurrent_annotations: int,
+    annotation_candidates: int,
+    export_parquet: bool,
+    max_output_tokens: int | None,
 ):
     """Run the annotation pipeline with specified configuration."""
-    asyncio.run(
+    _run_async(
         _run_pipeline(
             hf_id=hf_id,
             filename=filename,
@@ -85,6 +120,10 @@ def run(
             subset_size=subset_size,
             batch_size=batch_size,
             annotation_model=annotation_model,
+            max_concurrent_annotations=max_concurrent_annotations,
+            annotation_candidates=annotation_candidates,
+            export_parquet=export_parquet,
+            max_output_tokens=max_output_tokens,
         )
     )
 
@@ -98,8 +137,19 @@ async def _run_pipeline(
     subset_size: int,
     batch_size: int,
     annotation_model: str,
+    max_concurrent_annotations: int,
+    annotation_candidates: int,
+    export_parquet: bool,
+    max_output_tokens: int | None,
 ):
     """Run the annotation pipeline with example configuration."""
+    from metta_nl_corpus.lib.pipeline_config import DatasetConfig, PipelineRunConfig
+    from metta_nl_corpus.services.pipeline_executor import (
+        ExecutionResult,
+        ExecutionStatus,
+        PipelineExecutor,
+    )
+
     # Configure your dataset
     dataset_config = DatasetConfig(
         hf_id=hf_id,
@@ -116,6 +166,10 @@ async def _run_pipeline(
         subset_size=subset_size,
         batch_size=batch_size,
         annotation_model=annotation_model,
+        max_concurrent_annotations=max_concurrent_annotations,
+        annotation_candidates=annotation_candidates,
+        export_parquet=export_parquet,
+        max_output_tokens=max_output_tokens,
     )
 
     logger.info(
@@ -124,6 +178,7 @@ async def _run_pipeline(
         model=pipeline_config.annotation_model,
         subset_size=pipeline_config.subset_size,
         batch_size=pipeline_config.batch_size,
+        max_concurrent_annotations=pipeline_config.max_concurrent_annotations,
         cache_key=pipeline_config.cache_key,
     )
 
@@ -159,7 +214,7 @@ async def _run_pipeline(
 )
 def clean(hf_id: str, filename: str):
     """Clean and re-validate a bronze dataset."""
-    asyncio.run(
+    _run_async(
         _run_clean_pipeline(
             hf_id=hf_id,
             filename=filename,
@@ -172,6 +227,12 @@ async def _run_clean_pipeline(
     filename: str,
 ):
     """Run the cleaning pipeline."""
+    from metta_nl_corpus.services.pipeline_executor import (
+        ExecutionResult,
+        ExecutionStatus,
+        PipelineExecutor,
+    )
+
     logger.info(
         "Starting clean pipeline",
         hf_id=hf_id,
@@ -258,7 +319,7 @@ def annotate(
     label: str | None,
 ):
     """Lightweight batch annotation — no Dagster, no subprocess validation."""
-    asyncio.run(
+    _run_async(
         _run_annotate(
             model=model,
             batch_size=batch_size,
@@ -278,6 +339,7 @@ async def _run_annotate(
 ):
     from metta_nl_corpus.constants import ANNOTATION_GUIDELINE_PATH, ANNOTATIONS_DB_PATH
     from metta_nl_corpus.lib.data_source import yield_unannotated_pairs
+    from metta_nl_corpus.lib.helpers import read_text_cached
     from metta_nl_corpus.lib.storage import AnnotationStore
     from metta_nl_corpus.models import RelationKind
     from metta_nl_corpus.services.defs.transformation.assets import (
@@ -303,7 +365,7 @@ async def _run_annotate(
         logger.info("No unannotated pairs found — nothing to do.")
         return
 
-    system_prompt = ANNOTATION_GUIDELINE_PATH.read_text()
+    system_prompt = read_text_cached(ANNOTATION_GUIDELINE_PATH)
     agent = _create_metta_agent(system_prompt, model)
 
     total_input_tokens = 0
@@ -19,7 +19,7 @@ from starlette.routing import Route
 from structlog import get_logger
 
 from metta_nl_corpus.constants import ANNOTATION_GUIDELINE_PATH, ANNOTATIONS_DB_PATH
-from metta_nl_corpus.lib.helpers import parse_all
+from metta_nl_corpus.lib.helpers import parse_all, read_text_cached
 from metta_nl_corpus.lib.storage import AnnotationStore
 from metta_nl_corpus.models import RelationKind
 
@@ -68,7 +68,7 @@ async def _annotate_title(title: str, model: str) -> AnnotateResponse:
         last_generation_attempt,
     )
 
-    system_prompt = ANNOTATION_GUIDELINE_PATH.read_text()
+    system_prompt = read_text_cached(ANNOTATION_GUIDELINE_PATH)
     agent = _create_metta_agent(system_prompt, model)
     deps = ExpressionDeps(
         premise=title,
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 from typing import NamedTuple
 
 import polars as pl
 from structlog import get_logger
 
-from metta_nl_corpus.lib.helpers import str_index
+from metta_nl_corpus.lib.helpers import str_index_expr
 from metta_nl_corpus.lib.storage import AnnotationStore
 from metta_nl_corpus.models import RelationKind
 
@@ -22,16 +23,33 @@ class UnannotatedPair(NamedTuple):
     label: str
 
 
-def _load_snli() -> pl.DataFrame:
-    """Download (cached) and load the SNLI training set."""
-    snli_path = Path(
-        __import__("huggingface_hub").hf_hub_download(
-            repo_id="stanfordnlp/snli",
-            filename="plain_text/train-00000-of-00001.parquet",
-            repo_type="dataset",
-        )
-    )
-    return pl.read_parquet(snli_path)
+@cache
+def get_snli_training_path() -> Path:
+    """Resolve the SNLI training parquet path, downloading from HF on first call.
+
+    Memoized per process so repeated callers (Dagster assets, MCP tools)
+    skip the hub round trip, and lazily invoked so importing this module
+    does not require network access. SNLI is immutable, so an already
+    cached copy is used without asking the hub for a newer revision.
+    """
+    from huggingface_hub import hf_hub_download
+    from huggingface_hub.errors import LocalEntryNotFoundError
+
+    download_args = {
+        "repo_id": "stanfordnlp/snli",
+        "filename": "plain_text/train-00000-of-00001.parquet",
+        "repo_type": "dataset",
+    }
+    try:
+        return Path(hf_hub_download(**download_args, local_files_only=True))
+    except LocalEntryNotFoundError:
+        logger.info("Downloading SNLI training set", repo_id=download_args["repo_id"])
+        return Path(hf_hub_download(**download_args))
+
+
+def _scan_snli() -> pl.LazyFrame:
+    """Lazily scan the (cached) SNLI training set."""
+    return pl.scan_parquet(get_snli_training_path())
 
 
 def yield_unannotated_pairs(
@@ -44,44 +62,51 @@ def yield_unannotated_pairs(
     """Return unannotated SNLI pairs not yet in the annotation store.
 
     Scans the SNLI training set starting at ``offset``, skips pairs whose
-    (premise, hypothesis) already exist in SQLite, and returns up to
-    ``limit`` unannotated pairs.
+    (premise, hypothesis) already exist in SQLite or repeat earlier in the
+    scan, and returns up to ``limit`` unannotated pairs.
     """
-    df = _load_snli()
-
-    label_fn = str_index(RelationKind, RelationKind.NO_LABEL)
-    df = df.with_row_index("snli_index").with_columns(
-        pl.col("label").map_elements(label_fn, return_dtype=pl.Utf8).alias("label_str")
+    lf = _scan_snli().with_row_index("snli_index")
+    lf = lf.filter(pl.col("snli_index") >= offset).with_columns(
+        str_index_expr("label", RelationKind, RelationKind.NO_LABEL).alias("label_str")
     )
 
-    df = df.filter(pl.col("snli_index") >= offset)
-
     if label:
-        df = df.filter(pl.col("label_str") == label.lower().strip())
+        lf = lf.filter(pl.col("label_str") == label.lower().strip())
 
-    df = df.filter(pl.col("label_str") != RelationKind.NO_LABEL.value)
+    lf = lf.filter(pl.col("label_str") != RelationKind.NO_LABEL.value)
 
     conn = store._get_conn()
-    existing = {
-        (row[0], row[1])
-        for row in conn.execute(
-            "SELECT premise, hypothesis FROM annotations"
-        ).fetchall()
-    }
+    existing = pl.DataFrame(
+        [
+            tuple(row)
+            for row in conn.execute(
+                "SELECT premise, hypothesis FROM annotations"
+            ).fetchall()
+        ],
+        schema={"premise": pl.String, "hypothesis": pl.String},
+        orient="row",
+    )
 
-    results: list[UnannotatedPair] = []
-    for row in df.iter_rows(named=True):
-        if len(results) >= limit:
-            break
-        key = (row["premise"], row["hypothesis"])
-        if key not in existing:
-            results.append(
-                UnannotatedPair(
-                    snli_index=row["snli_index"],
-                    premise=row["premise"],
-                    hypothesis=row["hypothesis"],
-                    label=row["label_str"],
-                )
-            )
-
-    return results
+    text_pair = ["premise", "hypothesis"]
+    df = (
+        lf.join(
+            existing.lazy(),
+            on=text_pair,
+            how="anti",
+            maintain_order="left",
+        )
+        # SNLI repeats some pairs under other indices; generate each once
+        .unique(subset=text_pair, keep="first", maintain_order=True)
+        .head(limit)
+        .collect(engine="streaming")
+    )
+
+    return [
+        UnannotatedPair(
+            snli_index=row["snli_index"],
+            premise=row["premise"],
+            hypothesis=row["hypothesis"],
+            label=row["label_str"],
+        )
+        for row in df.iter_rows(named=True)
+    ]
@@ -48,6 +48,19 @@ class SearchResult(NamedTuple):
     score: float
 
 
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the ``top_k`` highest scores, best first.
+
+    Partitions out the top K before sorting, so only those K are sorted
+    instead of the whole corpus.
+    """
+    k = min(top_k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(scores, len(scores) - k)[len(scores) - k :]
+    return top[np.argsort(scores[top])[::-1]]
+
+
 def search_vectors(
     query: str,
     corpus_ids: Sequence[str],
@@ -60,5 +73,5 @@ def search_vectors(
     """
     query_vec = embed_texts([query])[0]
     scores = corpus_vecs @ query_vec
-    top_indices = np.argsort(scores)[::-1][:top_k]
+    top_indices = _top_k_indices(scores, top_k)
     return [(corpus_ids[i], float(scores[i])) for i in top_indices]
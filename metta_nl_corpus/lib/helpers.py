@@ -1,5 +1,7 @@
 from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Iterable, Protocol, Callable
 
 import polars as pl
@@ -8,7 +10,7 @@ from dagster._core.execution.context.asset_execution_context import (
 )
 from hyperon import MeTTa
 
-from metta_nl_corpus.lib.interfaces import Fn, Transformation
+from metta_nl_corpus.lib.interfaces import Fn
 
 parse_all: Callable[Sequence[str], Sequence[str]] = MeTTa().parse_all
 
@@ -28,7 +30,7 @@ class Never:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Box[T]:
     data: T
     context: AssetExecutionContext | None = None
@@ -36,42 +38,55 @@ class Box[T]:
     def __or__[U](self, f: Fn["Box[T]", "Box[U]"]) -> "Box[U]":
         return f(self)
 
+    def pipe(self, *fs: Fn["Box[Any]", "Box[Any]"]) -> "Box[Any]":
+        """Apply each transformation in order; equivalent to chaining `|`."""
+        box: Box[Any] = self
+        for f in fs:
+            box = f(box)
+        return box
+
+
+@dataclass(slots=True, frozen=True)
+class Bind:
+    f: Fn
 
-def bind(f: Fn):
-    def unit(box: Box[pl.DataFrame]) -> Box[pl.DataFrame]:
-        return f(box)
+    def __call__(self, box: Box[pl.DataFrame]) -> Box[pl.DataFrame]:
+        return self.f(box)
 
-    return unit
 
+@dataclass(slots=True, frozen=True)
+class Info:
+    msg: str
+    args: tuple[Any, ...] = ()
 
-def info(msg: str, *args: Any):
-    def unit(box: Box[pl.DataFrame]) -> Box[pl.DataFrame]:
+    def __call__(self, box: Box[pl.DataFrame]) -> Box[pl.DataFrame]:
         assert box.context
-        box.context.log.info(msg, *args)
+        box.context.log.info(self.msg, *self.args)
         return box
 
-    return unit
 
+@dataclass(slots=True, frozen=True)
+class WithContext:
+    context: AssetExecutionContext
 
-def with_context(context: AssetExecutionContext) -> Transformation[Box[pl.DataFrame]]:
-    def unit(box: Box[pl.DataFrame]) -> Box[pl.DataFrame]:
-        return Box(box.data, context)
+    def __call__(self, box: Box[pl.DataFrame]) -> Box[pl.DataFrame]:
+        return Box(box.data, self.context)
 
-    return unit
 
+@dataclass(slots=True, frozen=True)
+class OnData[U]:
+    f: Fn[pl.DataFrame, U]
 
-def on_data[T, U](f: Fn[pl.DataFrame, U]) -> Fn[Box[pl.DataFrame], Box[U]]:
-    def unit(box: Box[pl.DataFrame]) -> Box[U]:
-        return Box(f(box.data), box.context)
-
-    return unit
+    def __call__(self, box: Box[pl.DataFrame]) -> Box[U]:
+        return Box(self.f(box.data), box.context)
 
 
 def str_index[T](mapping: Iterable, coalesce: T = Never) -> Fn[int, T]:
+    values = tuple(mapping)
+
     def inner(number: int) -> T:
-        for i, n in enumerate(mapping):
-            if i == number:
-                return n
+        if 0 <= number < len(values):
+            return values[number]
 
         if coalesce != Never:
             return coalesce
@@ -81,6 +96,31 @@ def str_index[T](mapping: Iterable, coalesce: T = Never) -> Fn[int, T]:
     return inner
 
 
+def str_index_expr(
+    column: str,
+    mapping: Iterable[str],
+    coalesce: str,
+    return_dtype: pl.DataType = pl.String,
+) -> pl.Expr:
+    """Vectorized `str_index` over an integer column, evaluated natively by Polars."""
+    return pl.col(column).replace_strict(
+        {i: str(n) for i, n in enumerate(mapping)},
+        default=coalesce,
+        return_dtype=return_dtype,
+    )
+
+
+@lru_cache(maxsize=16)
+def _read_text_version(path: Path, mtime_ns: int) -> str:
+    return path.read_text()
+
+
+def read_text_cached(path: Path) -> str:
+    """Read a text file, hitting the disk again only after it is modified."""
+    resolved = path.resolve()
+    return _read_text_version(resolved, resolved.stat().st_mtime_ns)
+
+
 def to_metta_tuple(expression: str) -> str:
     if len(atoms := parse_all(expression)) > 1:
         return f"(, {' '.join(map(str, atoms))})"
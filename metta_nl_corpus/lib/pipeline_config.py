@@ -32,6 +32,10 @@ class PipelineRunConfig(BaseModel):
     batch_size: int = 10
     annotation_model: str = "openai:gpt-5-nano"  # Full model string, e.g. "openai:gpt-4o-mini" or "anthropic:claude-3-5-sonnet"
     offset: int = 0  # Start processing from this training data index
+    max_concurrent_annotations: int = 8  # In-flight generation calls per batch
+    annotation_candidates: int = 1  # Concurrent generations per row; first valid wins
+    export_parquet: bool = True  # Rewrite the full parquet snapshot after each run
+    max_output_tokens: int | None = None  # Per-response token cap; None = model default
 
     @property
     def cache_key(self) -> str:
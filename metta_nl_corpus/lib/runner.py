@@ -269,11 +269,15 @@ def _parse_petta_output(stdout: str) -> Sequence[Sequence[str]]:
     return results
 
 
+def default_backend() -> MeTTaBackend:
+    """Backend selected by the METTA_BACKEND env var (hyperon when unset)."""
+    return MeTTaBackend(os.environ.get("METTA_BACKEND", MeTTaBackend.HYPERON))
+
+
 def create_runner(backend: MeTTaBackend | None = None) -> MeTTaRunner:
     """Factory for MeTTa runners, defaulting to METTA_BACKEND env var."""
     if backend is None:
-        raw = os.environ.get("METTA_BACKEND", MeTTaBackend.HYPERON)
-        backend = MeTTaBackend(raw)
+        backend = default_backend()
 
     if backend == MeTTaBackend.JANUS:
         petta_path = _default_petta_path()
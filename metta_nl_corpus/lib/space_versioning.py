@@ -1,7 +1,9 @@
 """Utilities for versioning MeTTa space files."""
 
 import hashlib
+import os
 import subprocess
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import NamedTuple
 
@@ -9,6 +11,14 @@ from structlog import getLogger
 
 logger = getLogger(__name__)
 
+# Last-commit hash per (resolved file path, mtime_ns, repository HEAD). Editing
+# a space file changes its mtime and committing it moves HEAD, so either one
+# makes the next lookup query git again.
+_GIT_COMMIT_HASHES: dict[tuple[Path, int, str], str] = {}
+
+# Prefix marking commit lines in `git log --name-only` output.
+_COMMIT_MARKER = "\x00"
+
 
 class SpaceVersion(NamedTuple):
     """Version information for a MeTTa space file."""
@@ -17,44 +27,82 @@ class SpaceVersion(NamedTuple):
     git_commit_hash: str | None  # Git commit hash if file is tracked
 
 
+def _repo_head(cwd: Path) -> str | None:
+    """Commit checked out in the repository containing ``cwd``, or None."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=False,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _cache_key(resolved: Path, head: str | None) -> tuple[Path, int, str] | None:
+    """Key `_GIT_COMMIT_HASHES`; None (never cached) without a HEAD or mtime."""
+    if head is None:
+        return None
+    try:
+        return resolved, resolved.stat().st_mtime_ns, head
+    except OSError:
+        return None
+
+
 def compute_file_hash(file_path: Path) -> str:
     """
     Compute MD5 hash of a file.
 
+    MD5 is kept so hashes stay comparable with those already stored on
+    validation records; ``hashlib.file_digest`` reads the file in C.
+
     Args:
         file_path: Path to the file
 
     Returns:
         MD5 hash as hexadecimal string
     """
-    hasher = hashlib.md5()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        return hashlib.file_digest(f, "md5").hexdigest()
 
 
 def get_git_commit_hash(file_path: Path) -> str | None:
     """
     Get the git commit hash for the last commit that modified a file.
 
+    Successful lookups are cached until the file's mtime or the repository
+    HEAD changes; checking HEAD costs one `git rev-parse` per call.
+
     Args:
         file_path: Path to the file
 
     Returns:
         Git commit hash or None if not in a git repo or file not tracked
     """
+    resolved = file_path.resolve()
+    key = _cache_key(resolved, _repo_head(resolved.parent))
+    if key in _GIT_COMMIT_HASHES:
+        return _GIT_COMMIT_HASHES[key]
+
     try:
         result = subprocess.run(
-            ["git", "log", "-n", "1", "--pretty=format:%H", "--", str(file_path)],
-            cwd=file_path.parent,
+            ["git", "log", "-n", "1", "--pretty=format:%H", "--", str(resolved)],
+            cwd=resolved.parent,
             capture_output=True,
             text=True,
             timeout=5,
+            check=False,
         )
 
         if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
+            commit_hash = result.stdout.strip()
+            if key is not None:
+                _GIT_COMMIT_HASHES[key] = commit_hash
+            return commit_hash
 
         logger.warning(
             "Could not get git commit hash for file",
@@ -63,7 +111,7 @@ def get_git_commit_hash(file_path: Path) -> str | None:
         )
         return None
 
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
+    except (subprocess.SubprocessError, OSError) as e:
         logger.warning(
             "Failed to get git commit hash",
             file_path=str(file_path),
@@ -72,6 +120,75 @@ def get_git_commit_hash(file_path: Path) -> str | None:
         return None
 
 
+def get_git_commit_hashes(file_paths: Sequence[Path]) -> Mapping[Path, str | None]:
+    """
+    Get last-commit hashes for several files with a single `git log` call.
+
+    Paths already cached for the current HEAD are not queried again. Any path
+    the batched query could not resolve falls back to `get_git_commit_hash`.
+
+    Args:
+        file_paths: Paths to the files
+
+    Returns:
+        Mapping of each path (as passed in) to its git commit hash, or None
+    """
+    if not file_paths:
+        return {}
+
+    resolved_paths = {path: path.resolve() for path in file_paths}
+    cwd = Path(os.path.commonpath([path.parent for path in resolved_paths.values()]))
+    head = _repo_head(cwd)
+    keys = {path: _cache_key(path, head) for path in resolved_paths.values()}
+    missing: list[Path] = [
+        path for path, key in keys.items() if key not in _GIT_COMMIT_HASHES
+    ]
+
+    if missing:
+        try:
+            result = subprocess.run(
+                [
+                    "git",
+                    "log",
+                    "--pretty=format:%x00%H",
+                    "--name-only",
+                    "--relative",
+                    "--",
+                    *(str(path) for path in missing),
+                ],
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                timeout=5,
+                check=False,
+            )
+            pending: set[Path] = set(missing) if result.returncode == 0 else set()
+            commit_hash: str | None = None
+            for line in result.stdout.splitlines():
+                if not pending:
+                    break
+                if line.startswith(_COMMIT_MARKER):
+                    commit_hash = line.removeprefix(_COMMIT_MARKER)
+                elif line and commit_hash:
+                    path = (cwd / line).resolve()
+                    if path in pending:
+                        if (key := keys[path]) is not None:
+                            _GIT_COMMIT_HASHES[key] = commit_hash
+                        pending.discard(path)
+
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.warning(
+                "Failed to get git commit hashes",
+                file_paths=[str(path) for path in missing],
+                error=str(e),
+            )
+
+    return {
+        path: _GIT_COMMIT_HASHES.get(keys[resolved]) or get_git_commit_hash(path)
+        for path, resolved in resolved_paths.items()
+    }
+
+
 def get_space_version(space_file_path: Path) -> SpaceVersion:
     """
     Get version information for a MeTTa space file.
@@ -82,10 +199,11 @@ def get_space_version(space_file_path: Path) -> SpaceVersion:
     Returns:
         SpaceVersion with file hash and git commit hash
     """
-    if not space_file_path.exists():
-        raise FileNotFoundError(f"Space file not found: {space_file_path}")
+    try:
+        file_hash = compute_file_hash(space_file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Space file not found: {space_file_path}") from None
 
-    file_hash = compute_file_hash(space_file_path)
     git_hash = get_git_commit_hash(space_file_path)
 
     logger.info(
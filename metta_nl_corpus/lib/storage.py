@@ -10,7 +10,8 @@ from __future__ import annotations
 import json
 import sqlite3
 import threading
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -57,6 +58,44 @@ def _columns_from_model(
     return columns
 
 
+@cache
+def schema_dtypes(model: type[DataFrameModel]) -> Mapping[str, pl.DataType]:
+    """Polars dtypes of a Pandera DataFrameModel, memoized per model class."""
+    return {k: v.type for k, v in model.to_schema().dtypes.items()}
+
+
+def conform_to_model(df: pl.DataFrame, model: type[DataFrameModel]) -> pl.DataFrame:
+    """Select ``model``'s columns in schema order, adding absent ones as nulls.
+
+    Frames conformed to the same model can be stacked with a plain vertical
+    concat instead of diagonal schema alignment.
+    """
+    return df.select(
+        pl.col(name) if name in df.columns else pl.lit(None, dtype).alias(name)
+        for name, dtype in schema_dtypes(model).items()
+    )
+
+
+try:
+    import orjson
+except ImportError:  # optional extra; fall back to the stdlib codec
+    orjson = None
+
+
+def _dumps_vector(vector: Sequence[float]) -> str:
+    """Encode an embedding vector as JSON text, via orjson when installed."""
+    if orjson is None:
+        return json.dumps(vector)
+    return orjson.dumps(vector, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _loads_vector(text: str) -> list[float]:
+    """Decode an embedding vector stored by `_dumps_vector`."""
+    if orjson is None:
+        return json.loads(text)
+    return orjson.loads(text)
+
+
 _ANNOTATIONS_COLUMNS = _columns_from_model(Annotation, _PRIMARY_KEYS["annotations"])
 _VALIDATIONS_COLUMNS = _columns_from_model(Validation, _PRIMARY_KEYS["validations"])
 
@@ -89,6 +128,8 @@ class AnnotationStore:
             conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA busy_timeout=5000")
+            # In WAL mode NORMAL is still crash-safe and skips an fsync per commit.
+            conn.execute("PRAGMA synchronous=NORMAL")
             conn.row_factory = sqlite3.Row
             self._local.conn = conn
         return conn
@@ -154,6 +195,10 @@ class AnnotationStore:
         logger.debug("Inserted annotation", annotation_id=filtered.get("annotation_id"))
         return str(filtered.get("annotation_id", ""))
 
+    def insert_annotations(self, df: pl.DataFrame) -> int:
+        """INSERT all annotation rows of a DataFrame in one transaction. Returns row count."""
+        return self._insert_frame("annotations", df, _ANNOTATIONS_COLUMNS)
+
     def delete_annotation(self, annotation_id: str) -> bool:
         """DELETE an annotation by annotation_id. Returns True if a row was deleted."""
         conn = self._get_conn()
@@ -290,6 +335,37 @@ class AnnotationStore:
         conn.commit()
         return str(filtered.get("validation_id", ""))
 
+    def insert_validations(self, df: pl.DataFrame) -> int:
+        """INSERT all validation rows of a DataFrame in one transaction. Returns row count."""
+        return self._insert_frame("validations", df, _VALIDATIONS_COLUMNS)
+
+    def _insert_frame(
+        self,
+        table: str,
+        df: pl.DataFrame,
+        columns: Sequence[tuple[str, str]],
+    ) -> int:
+        """Bulk INSERT OR REPLACE the table's columns of ``df`` via executemany."""
+        col_names = {c[0] for c in columns}
+        selected = [
+            name for name in df.columns if _PL_TO_SQL.get(name, name) in col_names
+        ]
+        if df.is_empty() or not selected:
+            return 0
+        # Convert bools for SQLite.
+        frame = df.select(selected).with_columns(pl.col(pl.Boolean).cast(pl.Int64))
+
+        cols = ", ".join(_PL_TO_SQL.get(name, name) for name in selected)
+        placeholders = ", ".join("?" for _ in selected)
+        conn = self._get_conn()
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} ({cols}) VALUES ({placeholders})",
+                frame.iter_rows(),
+            )
+        logger.debug("Inserted rows", table=table, rows=len(frame))
+        return len(frame)
+
     # -- export / import -------------------------------------------------------
 
     def to_polars(self, table: str = "annotations") -> pl.DataFrame:
@@ -299,17 +375,22 @@ class AnnotationStore:
         so downstream Pandera validation sees the correct columns/types.
         """
         conn = self._get_conn()
-        cur = conn.execute(f"SELECT * FROM {table}")
+        # Plain tuples, loaded column-wise: no per-row dict or Row objects.
+        cur = conn.cursor()
+        cur.row_factory = None
+        cur.execute(f"SELECT * FROM {table}")
         rows = cur.fetchall()
         if not rows:
             model = _TABLE_MODELS.get(table)
             if model is not None:
-                dtypes = {k: v.type for k, v in model.to_schema().dtypes.items()}
-                return pl.DataFrame(schema=dtypes)
+                return pl.DataFrame(schema=schema_dtypes(model))
             return pl.DataFrame()
-        dicts = [self._row_to_dict(dict(r), source=table) for r in rows]
-        # Use a generous infer_schema_length to handle mixed types
-        return pl.DataFrame(dicts, infer_schema_length=len(dicts))
+        columns = [_SQL_TO_PL.get(c[0], c[0]) for c in cur.description]
+        # Scan every row when inferring dtypes to handle mixed types
+        df = pl.DataFrame(rows, schema=columns, orient="row", infer_schema_length=None)
+        if "is_valid" in df.columns:
+            df = df.with_columns(pl.col("is_valid").cast(pl.Boolean))
+        return df
 
     def export_parquet(self, path: Path, table: str = "annotations") -> int:
         """Export table to parquet. Returns row count."""
@@ -324,17 +405,15 @@ class AnnotationStore:
 
     def import_parquet(self, path: Path, table: str = "annotations") -> int:
         """Import rows from a parquet file. Returns number of rows imported."""
-        if not path.exists():
+        try:
+            df = pl.read_parquet(path)
+        except FileNotFoundError:
             logger.warning("Parquet file not found", path=str(path))
             return 0
-        df = pl.read_parquet(path)
-        count = 0
-        for row in df.to_dicts():
-            if table == "annotations":
-                self.insert_annotation(row)
-            else:
-                self.insert_validation(row)
-            count += 1
+        if table == "annotations":
+            count = self.insert_annotations(df)
+        else:
+            count = self.insert_validations(df)
         logger.info("Imported from parquet", path=str(path), rows=count, table=table)
         return count
 
@@ -352,7 +431,7 @@ class AnnotationStore:
         conn.execute(
             "INSERT OR REPLACE INTO embeddings (annotation_id, field, vector, model) "
             "VALUES (?, ?, ?, ?)",
-            (annotation_id, field, json.dumps(vector), model),
+            (annotation_id, field, _dumps_vector(vector), model),
         )
         conn.commit()
 
@@ -365,7 +444,10 @@ class AnnotationStore:
         conn.executemany(
             "INSERT OR REPLACE INTO embeddings (annotation_id, field, vector, model) "
             "VALUES (?, ?, ?, ?)",
-            [(aid, field, json.dumps(vec), model) for aid, field, vec, model in rows],
+            [
+                (aid, field, _dumps_vector(vec), model)
+                for aid, field, vec, model in rows
+            ],
         )
         conn.commit()
         return len(rows)
@@ -384,7 +466,7 @@ class AnnotationStore:
         if not rows:
             return [], np.empty((0, 384), dtype=np.float32)
         ids = [r[0] for r in rows]
-        vecs = np.array([json.loads(r[1]) for r in rows], dtype=np.float32)
+        vecs = np.array([_loads_vector(r[1]) for r in rows], dtype=np.float32)
         return ids, vecs
 
     def count_embeddings(self, field: str = "premise") -> int:
@@ -7,8 +7,11 @@ Context Protocol.
 
 from __future__ import annotations
 
+import sys
 import threading
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
@@ -24,7 +27,7 @@ from metta_nl_corpus.constants import (
     UPPER_ONTOLOGY_PATH,
     VALIDATIONS_PATH,
 )
-from metta_nl_corpus.lib.helpers import parse_all
+from metta_nl_corpus.lib.helpers import parse_all, read_text_cached
 from metta_nl_corpus.lib.io import IO
 from metta_nl_corpus.lib.runner import JanusPeTTaRunner, create_runner
 from metta_nl_corpus.lib.storage import AnnotationStore
@@ -40,6 +43,20 @@ CONTRADICTIONS_PATH = (
     PROJECT_ROOT / "metta_nl_corpus/services/spaces/contradictions.metta"
 )
 
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release the pipeline executor's thread pool when the server stops."""
+    try:
+        yield
+    finally:
+        # The executor is imported by the first run_pipeline call; without
+        # one there is no pool to shut down and no reason to import it now.
+        executor = sys.modules.get("metta_nl_corpus.services.pipeline_executor")
+        if executor is not None:
+            executor.shutdown_materialize_pool()
+
+
 mcp = FastMCP(
     "metta-nl-corpus",
     instructions=(
@@ -49,6 +66,7 @@ mcp = FastMCP(
         "running batch pipelines, querying stored results, and extracting expressions "
         "from natural language sentences via add_expressions."
     ),
+    lifespan=_lifespan,
 )
 
 
@@ -125,14 +143,13 @@ def list_annotation_guidelines() -> dict[str, Any]:
 def set_annotation_guideline(version: str) -> dict[str, Any]:
     """Switch the active annotation guideline to a different version.
 
-    Updates the default.md symlink and invalidates the in-process cache.
+    Updates the default.md symlink; cached reads follow it to the new file.
 
     Args:
         version: Version name (e.g. 'v1_standard', 'v2_universal') — stem of the .md file.
     """
     from metta_nl_corpus.constants import PROMPTS_DIR
 
-    global _ANNOTATION_GUIDELINE_CACHE
     target = PROMPTS_DIR / f"{version}.md"
     if not target.exists():
         available = [p.stem for p in PROMPTS_DIR.glob("*.md") if p.name != "default.md"]
@@ -143,7 +160,6 @@ def set_annotation_guideline(version: str) -> dict[str, Any]:
     default_link = PROMPTS_DIR / "default.md"
     default_link.unlink(missing_ok=True)
     default_link.symlink_to(target.name)
-    _ANNOTATION_GUIDELINE_CACHE = None
     return {"success": True, "version": version, "path": str(target)}
 
 
@@ -190,7 +206,7 @@ def add_expressions(
         return {"success": False, "error": "No valid MeTTa atoms found."}
 
     annotation_id = str(uuid.uuid4())
-    system_prompt = ANNOTATION_GUIDELINE_PATH.read_text()
+    system_prompt = read_text_cached(ANNOTATION_GUIDELINE_PATH)
 
     try:
         store.insert_annotation(
@@ -275,7 +291,7 @@ def execute_metta(
 
     if store_result and premise is not None:
         annotation_id = str(uuid.uuid4())
-        system_prompt = ANNOTATION_GUIDELINE_PATH.read_text()
+        system_prompt = read_text_cached(ANNOTATION_GUIDELINE_PATH)
 
         try:
             store.insert_annotation(
@@ -362,7 +378,7 @@ def validate_relation(
 
     if store_result:
         annotation_id = str(uuid.uuid4())
-        system_prompt = ANNOTATION_GUIDELINE_PATH.read_text()
+        system_prompt = read_text_cached(ANNOTATION_GUIDELINE_PATH)
 
         try:
             store.insert_annotation(
@@ -429,7 +445,7 @@ async def ask_metta_agent(
             "error": f"Unknown relation '{relation}'. Use entailment, neutral, or contradiction.",
         }
 
-    system_prompt = ANNOTATION_GUIDELINE_PATH.read_text()
+    system_prompt = read_text_cached(ANNOTATION_GUIDELINE_PATH)
     agent = _create_metta_agent(system_prompt, model)
     deps = ExpressionDeps(premise=premise, hypothesis=hypothesis, label=label)
 
@@ -535,9 +551,10 @@ async def generate_and_validate(
     if result.annotation is None:
         return {"error": "Generation failed — no annotation produced."}
 
-    annotation_row = result.annotation.to_dicts()[0]
+    # Single-row frames: read the row directly rather than listing every row
+    annotation_row = result.annotation.row(0, named=True)
     validation_row = (
-        result.validation.to_dicts()[0] if result.validation is not None else None
+        result.validation.row(0, named=True) if result.validation is not None else None
     )
 
     return {
@@ -630,23 +647,26 @@ def query_annotations(
         cleaned_path = PROJECT_ROOT / "datasets" / "cleaned_annotations.parquet"
         if not cleaned_path.exists():
             return {"error": f"File not found: {cleaned_path}"}
+        # Lazy scan so the filter, count and head are planned together and
+        # only the requested rows are materialized.
         try:
-            df = pl.read_parquet(cleaned_path)
+            lf = pl.scan_parquet(cleaned_path)
+            columns = lf.collect_schema().names()
         except Exception as e:
             return {"error": f"Failed to read parquet: {e}"}
         if filter_column and filter_value:
-            if filter_column not in df.columns:
+            if filter_column not in columns:
                 return {
-                    "error": f"Column '{filter_column}' not found. Available: {df.columns}"
+                    "error": f"Column '{filter_column}' not found. Available: {columns}"
                 }
             col = pl.col(filter_column).cast(pl.Utf8)
             if isinstance(filter_value, list):
-                df = df.filter(col.is_in(filter_value))
+                lf = lf.filter(col.is_in(filter_value))
             else:
-                df = df.filter(col == filter_value)
-        total = len(df)
-        rows = df.head(limit).to_dicts()
-        columns = df.columns
+                lf = lf.filter(col == filter_value)
+        count_df, head_df = pl.collect_all([lf.select(pl.len()), lf.head(limit)])
+        total = count_df.item()
+        rows = head_df.to_dicts()
     else:
         result = store.query(
             table=file,
@@ -1107,14 +1127,10 @@ def _parse_expressions(text: str) -> list[str]:
     return [str(a) for a in atoms]
 
 
-_ANNOTATION_GUIDELINE_CACHE: str | None = None
-
-
 def _get_annotation_guideline() -> str:
-    global _ANNOTATION_GUIDELINE_CACHE
-    if _ANNOTATION_GUIDELINE_CACHE is None:
-        _ANNOTATION_GUIDELINE_CACHE = ANNOTATION_GUIDELINE_PATH.read_text()
-    return _ANNOTATION_GUIDELINE_CACHE
+    # Keyed on the resolved path and mtime, so switching the default.md
+    # symlink or rewriting the file is picked up without manual invalidation.
+    return read_text_cached(ANNOTATION_GUIDELINE_PATH)
 
 
 def _store_expressions(
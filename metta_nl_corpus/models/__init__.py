@@ -1,6 +1,7 @@
 from enum import StrEnum
 from typing import NamedTuple
 
+import polars as pl
 from pandera.polars import DataFrameModel, Field
 from pandera.typing.common import UInt32
 from pandera.typing.polars import DataFrame
@@ -63,7 +64,8 @@ class Validation(DataFrameModel):
     # JSON-encoded list of `!(add-proposition ...)` expressions fed to the MeTTa runner.
     expressions_added: str | None = Field(default=None, nullable=True)
     # str repr of `runner.run(expression_to_evaluate)` — the proof / inference chain.
-    # For NEUTRAL, JSON object with `entailment` and `contradiction` sub-results.
+    # For NEUTRAL, JSON object with `entailment` and `contradiction` sub-results
+    # (`contradiction` is null when entailment already held).
     inference_result: str | None = Field(default=None, nullable=True)
 
     class Config:
@@ -78,6 +80,10 @@ class RelationKind(StrEnum):
     NO_LABEL = "no_label"
 
 
+# Physical dtype for in-memory label columns: a u32 index into RelationKind.
+RELATION_KIND_DTYPE = pl.Enum(RelationKind)
+
+
 class GenerateAndValidateResult(NamedTuple):
     """Combined result of generation and validation."""
 
@@ -11,7 +11,7 @@ from structlog import getLogger
 
 from metta_nl_corpus.constants import ANNOTATIONS_DB_PATH, CLEANED_ANNOTATIONS_PATH
 from metta_nl_corpus.lib.storage import AnnotationStore
-from metta_nl_corpus.models import RelationKind
+from metta_nl_corpus.models import RELATION_KIND_DTYPE, RelationKind
 from metta_nl_corpus.services.defs.transformation.assets import (
     get_grounding_space_versions,
     validate_expressions_by_label,
@@ -22,12 +22,12 @@ logger = getLogger(__name__)
 VALIDATION_TIMEOUT_SECONDS = 5
 
 # Patterns that indicate the LLM included natural language instead of MeTTa
-_BAD_SYNTAX_PATTERNS = re.compile(
+_BAD_SYNTAX_SOURCE = (
     r"Here is|Rationale|previously|The hypothesis|The premise|"
     r"contradiction|entailment|Note:|Let me|I'll|we need|we can|"
-    r"```|Direct contradiction",
-    re.IGNORECASE,
+    r"```|Direct contradiction"
 )
+_BAD_SYNTAX_PATTERNS = re.compile(_BAD_SYNTAX_SOURCE, re.IGNORECASE)
 
 
 def migrate_not_to_is_not(expression: str) -> str:
@@ -35,11 +35,21 @@ def migrate_not_to_is_not(expression: str) -> str:
     return expression.replace("(not ", "(is-not ")
 
 
+def migrate_not_to_is_not_expr(column: str) -> pl.Expr:
+    """Vectorized `migrate_not_to_is_not` over a string column."""
+    return pl.col(column).str.replace_all("(not ", "(is-not ", literal=True)
+
+
 def has_bad_syntax(expression: str) -> bool:
     """Check if an expression contains natural language instead of valid MeTTa."""
     return bool(_BAD_SYNTAX_PATTERNS.search(expression))
 
 
+def has_bad_syntax_expr(column: str) -> pl.Expr:
+    """Vectorized `has_bad_syntax` over a string column."""
+    return pl.col(column).str.contains(f"(?i){_BAD_SYNTAX_SOURCE}")
+
+
 def _run_validation(
     label: str, metta_premise: str, metta_hypothesis: str, queue: multiprocessing.Queue
 ) -> None:
@@ -166,10 +176,7 @@ def cleaned_annotations(
 
     # Filter out rows where the LLM included natural language instead of MeTTa
     bad_syntax_mask = df.select(
-        pl.col("metta_premise").map_elements(has_bad_syntax, return_dtype=pl.Boolean)
-        | pl.col("metta_hypothesis").map_elements(
-            has_bad_syntax, return_dtype=pl.Boolean
-        )
+        has_bad_syntax_expr("metta_premise") | has_bad_syntax_expr("metta_hypothesis")
     ).to_series()
 
     bad_syntax_count = bad_syntax_mask.sum()
@@ -180,12 +187,8 @@ def cleaned_annotations(
 
     # Migrate (not ...) → (is-not ...) syntax
     df = df.with_columns(
-        pl.col("metta_premise").map_elements(
-            migrate_not_to_is_not, return_dtype=pl.String
-        ),
-        pl.col("metta_hypothesis").map_elements(
-            migrate_not_to_is_not, return_dtype=pl.String
-        ),
+        migrate_not_to_is_not_expr("metta_premise"),
+        migrate_not_to_is_not_expr("metta_hypothesis"),
     )
     logger.info("Migrated (not ...) to (is-not ...) syntax")
 
@@ -197,23 +200,26 @@ def cleaned_annotations(
         entailments_git_hash,
     ) = get_grounding_space_versions()
 
+    # Unknown labels are re-validated as neutral
+    validation_labels = df.get_column("label").replace_strict(
+        {kind.value: kind.value for kind in RelationKind},
+        default=RelationKind.NEUTRAL.value,
+        return_dtype=RELATION_KIND_DTYPE,
+    )
+
     # Re-validate each row
     total_rows = len(df)
     validation_results: list[bool] = []
-    for i, row in enumerate(df.iter_rows(named=True)):
+    for i, (label, metta_premise, metta_hypothesis) in enumerate(
+        zip(validation_labels, df["metta_premise"], df["metta_hypothesis"])
+    ):
         if (i + 1) % 50 == 0 or i == 0:
             logger.info("Validation progress", current=i + 1, total=total_rows)
 
-        label_str = row["label"]
-        try:
-            label = RelationKind(label_str)
-        except ValueError:
-            label = RelationKind.NEUTRAL
-
         is_valid = _validate_with_timeout(
-            label=label,
-            metta_premise=row["metta_premise"],
-            metta_hypothesis=row["metta_hypothesis"],
+            label=RelationKind(label),
+            metta_premise=metta_premise,
+            metta_hypothesis=metta_hypothesis,
         )
         validation_results.append(is_valid)
 
@@ -242,8 +248,7 @@ def cleaned_annotations(
 
     # Write cleaned data to SQLite and export parquet
     cleaned_store = AnnotationStore(ANNOTATIONS_DB_PATH)
-    for row in df.to_dicts():
-        cleaned_store.insert_annotation(row)
+    cleaned_store.insert_annotations(df)
 
     CLEANED_ANNOTATIONS_PATH.parent.mkdir(parents=True, exist_ok=True)
     df.write_parquet(CLEANED_ANNOTATIONS_PATH)
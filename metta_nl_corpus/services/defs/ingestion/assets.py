@@ -1,16 +1,16 @@
-from functools import cache
 from pathlib import Path
 
 import polars as pl
 from dagster import AssetExecutionContext, Config, asset
-from huggingface_hub import hf_hub_download
 from structlog import getLogger
 
 from metta_nl_corpus.constants import ANNOTATIONS_DB_PATH
-from metta_nl_corpus.lib.helpers import Box, info, str_index, with_context
+from metta_nl_corpus.lib.data_source import get_snli_training_path
+from metta_nl_corpus.lib.helpers import Box, Info, WithContext, str_index_expr
 from metta_nl_corpus.lib.interfaces import Fn
 from metta_nl_corpus.lib.storage import AnnotationStore
 from metta_nl_corpus.models import (
+    RELATION_KIND_DTYPE,
     Annotation,
     RelationKind,
     TrainingData,
@@ -22,52 +22,50 @@ logger = getLogger(__name__)
 SUBSET_SIZE = 50
 
 
-@cache
-def _get_training_dataset_path() -> str:
-    """Resolve the SNLI training parquet path, downloading from HF on first call.
-
-    Lazily invoked so importing this module does not require network access
-    (tests, type-checking, MCP server bootstrap all import this transitively).
-    """
-    return hf_hub_download(
-        repo_id="stanfordnlp/snli",
-        filename="plain_text/train-00000-of-00001.parquet",
-        repo_type="dataset",
-    )
-
-
 class BaseConfig(Config):
     training_dataset: str | None = None  # falls back to HF SNLI when unset
     version: str | None = None  # <None> for all versions
+    offset: int = 0  # rows before this training data index are never read
 
 
-type Loader = Fn[Path, Box[pl.DataFrame]]
-
+type Loader[T] = Fn[Path, Box[T]]
 
-def to_boxed_path_loader(method: Fn[Path, pl.DataFrame]) -> Loader:
-    def inner(file_path: Path) -> Box[pl.DataFrame]:
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found at {file_path}")
 
+def to_boxed_path_loader[T](method: Fn[Path, T]) -> Loader[T]:
+    # No exists() precheck: the Polars readers raise FileNotFoundError
+    # themselves (scanners when the frame is collected).
+    def inner(file_path: Path) -> Box[T]:
         return Box(data=method(file_path))
 
     return inner
 
 
-load_parquet_from_path = to_boxed_path_loader(pl.read_parquet)
+scan_parquet_from_path = to_boxed_path_loader(pl.scan_parquet)
 
 
 @asset
 def raw_training_data(
     context: AssetExecutionContext, config: BaseConfig
-) -> pl.DataFrame:
-    file_path = Path(config.training_dataset or _get_training_dataset_path())
-    df = (
-        load_parquet_from_path(file_path)
-        | with_context(context)
-        | info(f"Loading {context.asset_key} from {file_path}")
-    ).data
-    return TrainingData.validate(df)
+) -> pl.LazyFrame:
+    file_path = Path(config.training_dataset or get_snli_training_path())
+    lf = (
+        scan_parquet_from_path(file_path)
+        .pipe(
+            WithContext(context),
+            Info(f"Loading {context.asset_key} from {file_path}"),
+        )
+        .data
+    )
+    columns = [
+        str(Annotation.index),
+        str(TrainingData.premise),
+        str(TrainingData.hypothesis),
+        str(TrainingData.label),
+    ]
+    # Index before slicing so it stays the absolute training data index.
+    # Left lazy: downstream assets only collect the rows they annotate.
+    lf = lf.with_row_index(str(Annotation.index)).slice(config.offset).select(columns)
+    return TrainingData.validate(lf)
 
 
 @asset
@@ -90,17 +88,20 @@ def cached_validations(context: AssetExecutionContext) -> pl.DataFrame:
 
 @asset
 def preprocessed_training_data(
-    raw_training_data: pl.DataFrame,
-) -> pl.DataFrame:
+    raw_training_data: pl.LazyFrame,
+) -> pl.LazyFrame:
     """
     Join training data with premises and hypotheses.
     Creates a complete dataset for training with all text fields.
     """
 
-    df = raw_training_data.with_row_index().with_columns(
-        pl.col(str(TrainingData.label)).map_elements(
-            str_index(RelationKind, RelationKind.NO_LABEL), return_dtype=pl.String
+    lf = raw_training_data.with_columns(
+        str_index_expr(
+            str(TrainingData.label),
+            RelationKind,
+            RelationKind.NO_LABEL,
+            return_dtype=RELATION_KIND_DTYPE,
         )
     )
 
-    return df
+    return lf
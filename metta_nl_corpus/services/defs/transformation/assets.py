@@ -1,9 +1,13 @@
 import asyncio
 import json
+import re
 import threading
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence, Sized
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import batched, islice
 from pathlib import Path
 from typing import Any, NamedTuple
 from uuid import uuid4
@@ -15,12 +19,13 @@ from dotenv import load_dotenv
 from httpx import HTTPStatusError
 from huggingface_hub.utils.tqdm import tqdm
 from pydantic import BaseModel, model_validator
-from pydantic_ai import Agent, RunContext
+from pydantic_ai import Agent, AgentRunResult, RunContext
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.retries import AsyncTenacityTransport, RetryConfig, wait_retry_after
+from pydantic_ai.settings import ModelSettings
 from structlog import getLogger
-from tenacity import retry_if_exception_type, stop_after_attempt, wait_exponential
+from tenacity import retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from metta_nl_corpus.constants import (
     ANNOTATION_GUIDELINE_PATH,
@@ -29,18 +34,27 @@ from metta_nl_corpus.constants import (
     PROJECT_ROOT,
     VALIDATIONS_PATH,
 )
-from metta_nl_corpus.lib.storage import AnnotationStore
+from metta_nl_corpus.lib.storage import (
+    AnnotationStore,
+    conform_to_model,
+    schema_dtypes,
+)
 from metta_nl_corpus.lib.helpers import (
     cleanup_metta_expression,
     parse_all,
+    read_text_cached,
     to_metta_tuple,
 )
 from metta_nl_corpus.lib.interfaces import Fn
-from metta_nl_corpus.lib.runner import create_runner
+from metta_nl_corpus.lib.runner import MeTTaBackend, create_runner, default_backend
 from metta_nl_corpus.lib.pipeline_config import PipelineRunConfig
-from metta_nl_corpus.lib.space_versioning import get_space_version
+from metta_nl_corpus.lib.space_versioning import (
+    get_git_commit_hashes,
+    get_space_version,
+)
 from metta_nl_corpus.models import (
     DATA_VERSION,
+    RELATION_KIND_DTYPE,
     Annotation,
     GenerateAndValidateResult,
     RelationKind,
@@ -56,6 +70,12 @@ load_dotenv(".env.local")
 # Module-level dict (not ContextVar) so it's visible across async task boundaries.
 last_generation_attempt: dict[str, Any] = {}
 
+# Column names resolved once; the per-row lookups in data_annotations use them
+_INDEX_COL = str(Annotation.index)
+_PREMISE_COL = str(TrainingData.premise)
+_HYPOTHESIS_COL = str(TrainingData.hypothesis)
+_LABEL_COL = str(TrainingData.label)
+
 ENTAILMENTS_PATH = PROJECT_ROOT / "metta_nl_corpus/services/spaces/inference.metta"
 CONTRADICTIONS_PATH = (
     PROJECT_ROOT / "metta_nl_corpus/services/spaces/contradictions.metta"
@@ -69,29 +89,30 @@ def pandera_record(d: dict[Any, Any]) -> pl.DataFrame:
     return pl.DataFrame(str_dict)
 
 
+_CODE_BLOCK_RE = re.compile(r"```[^\n]*\n(.*?)\n```", re.DOTALL)
+_COMMENT_LINE_RE = re.compile(r"^[^\S\n]*;[^\n]*(?:\n|\Z)", re.MULTILINE)
+# Any line whose first non-blank character is not '(' (blank lines included)
+_UNPARENTHESIZED_LINE_RE = re.compile(r"^(?![^\S\n]*\()[^\n]*$", re.MULTILINE)
+
+
+def _wrap_bare_line(match: re.Match[str]) -> str:
+    stripped = match.group().strip()
+    if not stripped:
+        return ""
+    logger.debug("Wrapping bare tokens in parentheses", bare_line=stripped)
+    return f"({stripped})"
+
+
 def _ensure_parenthesized(code: str) -> str:
     """Ensure each top-level line of MeTTa code is wrapped in parentheses.
 
     Bare tokens like `jumpedOver a-person airplane` are invalid and get
     wrapped as `(jumpedOver a-person airplane)`.  Lines that already start
-    with '(' (possibly indented) or are empty are left unchanged, preserving
-    their original indentation for multiline expressions.
+    with '(' (possibly indented) are left unchanged, preserving their original
+    indentation for multiline expressions; blank lines are emptied.
     """
-    lines = code.split("\n")
-    fixed: list[str] = []
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            fixed.append("")
-            continue
-        # Already parenthesized or is a continuation line — preserve original formatting
-        if stripped.startswith("("):
-            fixed.append(line)
-        else:
-            # Bare tokens – wrap them
-            logger.debug("Wrapping bare tokens in parentheses", bare_line=stripped)
-            fixed.append(f"({stripped})")
-    return "\n".join(fixed)
+    # Lines that already start with '(' never leave the regex engine
+    return _UNPARENTHESIZED_LINE_RE.sub(_wrap_bare_line, code)
 
 
 def parse_metta_expression(expression: str) -> str:
@@ -101,10 +122,8 @@ def parse_metta_expression(expression: str) -> str:
     Removes lines that start with ';' (MeTTa comments).
     Ensures all expressions are properly parenthesized.
     """
-    import re
-
     # Find all code blocks (with optional language identifier)
-    matches = re.findall(r"```[^\n]*\n(.*?)\n```", expression, re.DOTALL)
+    matches = _CODE_BLOCK_RE.findall(expression)
     if matches:
         # Get the last match
         code = matches[-1].strip()
@@ -113,10 +132,7 @@ def parse_metta_expression(expression: str) -> str:
         code = expression.strip()
 
     # Remove lines that start with ';' (MeTTa comments)
-    lines = code.split("\n")
-    filtered_lines = [line for line in lines if not line.lstrip().startswith(";")]
-
-    code = "\n".join(filtered_lines).strip()
+    code = _COMMENT_LINE_RE.sub("", code).strip()
 
     # Ensure all expressions are parenthesized
     return _ensure_parenthesized(code)
@@ -223,11 +239,18 @@ def validate_relation_tool(
             "valid": False,
             "message": f"Unknown relation '{expected_relation}'. Use entailment, neutral, or contradiction.",
         }
+    metta_premise = metta_premise.strip()
+    metta_hypothesis = metta_hypothesis.strip()
+    # A blank side can't be checked (and would pass as neutral), so answer
+    # without starting any MeTTa runs.
+    if not metta_premise or not metta_hypothesis:
+        side = "metta_premise" if not metta_premise else "metta_hypothesis"
+        return {"valid": False, "message": f"{side} is empty."}
     try:
         is_valid = validate_expressions_by_label(
             label=label,
-            metta_premise=metta_premise.strip(),
-            metta_hypothesis=metta_hypothesis.strip(),
+            metta_premise=metta_premise,
+            metta_hypothesis=metta_hypothesis,
         )
         return {
             "valid": is_valid,
@@ -239,13 +262,26 @@ def validate_relation_tool(
         return {"valid": False, "message": f"Validation failed: {e}"}
 
 
+# Rate limits, request timeouts/conflicts and server-side failures.
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+def _is_transient_http_error(exc: BaseException) -> bool:
+    """Whether a failed request is worth retrying (4xx client errors are not)."""
+    if isinstance(exc, HTTPStatusError):
+        status = exc.response.status_code
+        return status in _RETRYABLE_STATUS_CODES or status >= 500
+    return isinstance(exc, (httpx.ConnectError, httpx.TimeoutException))
+
+
 def _create_retrying_http_client() -> httpx.AsyncClient:
     """Create an httpx client with retries for rate limits and transient errors."""
     transport = AsyncTenacityTransport(
         config=RetryConfig(
-            retry=retry_if_exception_type((HTTPStatusError, httpx.ConnectError)),
+            retry=retry_if_exception(_is_transient_http_error),
             wait=wait_retry_after(
-                fallback_strategy=wait_exponential(multiplier=1, max=60),
+                # Jitter so concurrent rows that hit a limit together spread out
+                fallback_strategy=wait_random_exponential(multiplier=1, max=60),
                 max_wait=300,
             ),
             stop=stop_after_attempt(5),
@@ -266,10 +302,39 @@ def _resolve_model(model_str: str) -> str | OpenAIChatModel:
     return model_str
 
 
+@lru_cache(maxsize=4)
+def _task_instructions_prefix(inference_example: str) -> str:
+    """Row-independent part of the task instructions, built once per example text."""
+    return (
+        "CRITICAL RULES:\n"
+        "- Every expression MUST be wrapped in parentheses: (predicate subject).\n"
+        "- Bare tokens like `foo bar baz` are INVALID. Always write `(foo bar baz)`.\n"
+        "- For ENTAILMENT: premise expressions must allow deriving hypothesis via transitivity. "
+        "Use the same entity names so the inference engine can chain implications.\n"
+        "- For CONTRADICTION: the contradiction engine ONLY works with 2-element predicates (predicate entity). "
+        "Use compound predicate names like (onHorse a-person) instead of (on a-person horse). "
+        "The hypothesis MUST negate a property from the premise using ((is-not predicate) entity). "
+        "Both premise and hypothesis are added to the same space. The entities MUST match.\n"
+        "- For NEUTRAL: the expressions should be neither entailing nor contradictory.\n\n"
+        "Here is an example of how the inference engine works with propositions:\n"
+        f"```MeTTa\n{inference_example}\n```\n\n"
+        "Use parse_all_tool to verify your expressions are valid. "
+        "Use validate_relation_tool(metta_premise, metta_hypothesis, expected_relation) "
+        "with the expected relation from the task to verify your expressions match before returning. "
+        "Set 'relation' in AgentExpressionOutput to the expected relation (e.g. entailment, neutral, contradiction). "
+        "Return the final expressions via AgentExpressionOutput.\n\n"
+        "Generate MeTTa expressions for:\n"
+    )
+
+
 def _create_metta_agent(
-    system_prompt: str, model: str
+    system_prompt: str, model: str, max_output_tokens: int | None = None
 ) -> Agent[ExpressionDeps, AgentExpressionOutput]:
-    """Create the Pydantic AI agent for MeTTa expression generation."""
+    """Create the Pydantic AI agent for MeTTa expression generation.
+
+    ``max_output_tokens`` caps each model response so a runaway generation is
+    cut off by the server instead of decoding to the context limit.
+    """
 
     resolved_model = _resolve_model(model)
     agent = Agent(
@@ -277,6 +342,11 @@ def _create_metta_agent(
         deps_type=ExpressionDeps,
         output_type=AgentExpressionOutput,
         instructions=system_prompt,
+        model_settings=(
+            ModelSettings(max_tokens=max_output_tokens)
+            if max_output_tokens is not None
+            else None
+        ),
         tools=[parse_all_tool, validate_relation_tool],
         retries=1,  # More attempts for expression generation to succeed
         output_retries=1,  # More attempts for relation validation to succeed
@@ -285,31 +355,16 @@ def _create_metta_agent(
     @agent.instructions
     def add_task_context(ctx: RunContext[ExpressionDeps]) -> str:
         deps = ctx.deps
-        inference_example = (
+        inference_example = read_text_cached(
             PROJECT_ROOT / "metta_nl_corpus/services/spaces/inference-example.metta"
-        ).read_text()
+        )
+        # Row-independent rules come first and the pair comes last, so every
+        # request in a run shares the same prompt prefix for provider caching.
         return (
-            f"Generate MeTTa expressions for:\n"
+            f"{_task_instructions_prefix(inference_example)}"
             f"Premise: {deps.premise}\n"
             f"Hypothesis: {deps.hypothesis}\n"
-            f"Expected relation: {deps.label}\n\n"
-            "CRITICAL RULES:\n"
-            "- Every expression MUST be wrapped in parentheses: (predicate subject).\n"
-            "- Bare tokens like `foo bar baz` are INVALID. Always write `(foo bar baz)`.\n"
-            "- For ENTAILMENT: premise expressions must allow deriving hypothesis via transitivity. "
-            "Use the same entity names so the inference engine can chain implications.\n"
-            "- For CONTRADICTION: the contradiction engine ONLY works with 2-element predicates (predicate entity). "
-            "Use compound predicate names like (onHorse a-person) instead of (on a-person horse). "
-            "The hypothesis MUST negate a property from the premise using ((is-not predicate) entity). "
-            "Both premise and hypothesis are added to the same space. The entities MUST match.\n"
-            "- For NEUTRAL: the expressions should be neither entailing nor contradictory.\n\n"
-            "Here is an example of how the inference engine works with propositions:\n"
-            f"```MeTTa\n{inference_example}\n```\n\n"
-            "Use parse_all_tool to verify your expressions are valid. "
-            "Use validate_relation_tool(metta_premise, metta_hypothesis, expected_relation) "
-            "with the expected relation from the task to verify your expressions match before returning. "
-            "Set 'relation' in AgentExpressionOutput to the expected relation (e.g. entailment, neutral, contradiction). "
-            "Return the final expressions via AgentExpressionOutput."
+            f"Expected relation: {deps.label}"
         )
 
     return agent
@@ -317,6 +372,12 @@ def _create_metta_agent(
 
 VALIDATION_TIMEOUT_SECONDS = 10
 
+# Hyperon and PeTTa-subprocess runners are independent per instance, but every
+# JanusPeTTaRunner works on the one process-wide SWI-Prolog database. Janus
+# validations hold this lock so concurrent rows cannot see each other's
+# propositions.
+_JANUS_VALIDATION_LOCK = threading.Lock()
+
 
 class ValidationTrace(NamedTuple):
     """Outcome of a single MeTTa validation run, including the proof chain."""
@@ -337,6 +398,8 @@ def _run_validation_with_trace(
 
     The GIL is released during C-level MeTTa calls, so the main thread
     can join with a timeout.  Daemon threads are cleaned up on process exit.
+    With ``METTA_BACKEND=janus`` validations run one at a time, and time
+    spent waiting for the shared engine counts towards ``timeout``.
     """
     expressions_list = list(expressions_to_add_to_space)
 
@@ -350,14 +413,19 @@ def _run_validation_with_trace(
 
     def _run() -> None:
         try:
-            runner = create_runner()
-            metta_code = grounding_space_path.read_text()
-            runner.run(metta_code)
-            for expression in expressions_list:
-                runner.run(expression)
-            if verbose:
-                runner.run("!(all)")
-            result = runner.run(expression_to_evaluate)
+            # A fresh runner per call: the spaces bind `&a` to a new space and
+            # populate it with add-atom/add-proposition side effects, so a
+            # shared runner would leak propositions between validations.
+            shared_engine = default_backend() == MeTTaBackend.JANUS
+            with _JANUS_VALIDATION_LOCK if shared_engine else nullcontext():
+                runner = create_runner()
+                metta_code = read_text_cached(grounding_space_path)
+                runner.run(metta_code)
+                for expression in expressions_list:
+                    runner.run(expression)
+                if verbose:
+                    runner.run("!(all)")
+                result = runner.run(expression_to_evaluate)
             is_truthy = bool(result and len(result) > 0 and len(result[-1]) > 0)
             container["status"] = "ok"
             container["value"] = is_truthy
@@ -501,23 +569,29 @@ def validate_expressions_are_contradictory(
 
 def _neutral_trace(metta_premise: str, metta_hypothesis: str) -> ValidationTrace:
     ent = _entailing_trace(metta_premise, metta_hypothesis)
-    con = _contradictory_trace(metta_premise, metta_hypothesis)
-    is_neutral = not (ent.is_valid or con.is_valid)
+    # An entailing pair is already not neutral; skip the contradiction run.
+    con = (
+        None if ent.is_valid else _contradictory_trace(metta_premise, metta_hypothesis)
+    )
+    is_neutral = con is not None and not con.is_valid
     logger.debug(
         "Checking neutral",
         is_entailing=ent.is_valid,
-        is_contradictory=con.is_valid,
+        is_contradictory=con.is_valid if con is not None else None,
         result=is_neutral,
     )
     combined_result = json.dumps(
         {
             "entailment": ent.inference_result,
-            "contradiction": con.inference_result,
+            "contradiction": con.inference_result if con is not None else None,
         }
     )
     return ValidationTrace(
         is_valid=is_neutral,
-        expressions_added=[*ent.expressions_added, *con.expressions_added],
+        expressions_added=[
+            *ent.expressions_added,
+            *(con.expressions_added if con is not None else []),
+        ],
         inference_result=combined_result,
     )
 
@@ -560,6 +634,8 @@ def validate_expressions_by_label(
 
 
 def get_grounding_space_versions():
+    # Resolve both git hashes with one subprocess; get_space_version reuses them.
+    get_git_commit_hashes([CONTRADICTIONS_PATH, ENTAILMENTS_PATH])
     contradictions_git_hash, contradictions_code_hash = get_space_version(
         CONTRADICTIONS_PATH
     )
@@ -596,6 +672,9 @@ def _create_annotation_and_validation(
 ) -> GenerateAndValidateResult:
     """
     Shared logic to create annotation and validation records.
+
+    The single-row frames are built without Pandera validation; callers
+    validate whole batches at once via `_stack_results`.
     """
     metta_premise_cleaned = cleanup_metta_expression(last_metta_premise)
     metta_hypothesis_cleaned = cleanup_metta_expression(last_metta_hypothesis)
@@ -614,7 +693,7 @@ def _create_annotation_and_validation(
     }
     record["input_tokens"] = input_tokens
     record["output_tokens"] = output_tokens
-    annotation = Annotation.validate(pandera_record(record))
+    annotation = pandera_record(record)
 
     trace = _validate_by_label_with_trace(
         label=label,
@@ -622,22 +701,20 @@ def _create_annotation_and_validation(
         metta_hypothesis=metta_hypothesis_cleaned,
     )
 
-    validation = Validation.validate(
-        pandera_record(
-            {
-                Validation.validation_id: str(uuid4()),
-                Validation.annotation_id: annotation_id,
-                Validation.is_valid: trace.is_valid,
-                Validation.relation_kind: label,
-                Validation.entailment_space_hash: ENTAILMENT_SPACE_HASH,
-                Validation.entailment_git_commit_hash: ENTAILMENT_GIT_HASH,
-                Validation.contradiction_space_hash: CONTRADICTIONS_SPACE_HASH,
-                Validation.contradiction_git_commit_hash: CONTRADICTIONS_GIT_HASH,
-                Validation.validation_timestamp: datetime.now().isoformat(),
-                Validation.expressions_added: json.dumps(trace.expressions_added),
-                Validation.inference_result: trace.inference_result,
-            }
-        )
+    validation = pandera_record(
+        {
+            Validation.validation_id: str(uuid4()),
+            Validation.annotation_id: annotation_id,
+            Validation.is_valid: trace.is_valid,
+            Validation.relation_kind: label,
+            Validation.entailment_space_hash: ENTAILMENT_SPACE_HASH,
+            Validation.entailment_git_commit_hash: ENTAILMENT_GIT_HASH,
+            Validation.contradiction_space_hash: CONTRADICTIONS_SPACE_HASH,
+            Validation.contradiction_git_commit_hash: CONTRADICTIONS_GIT_HASH,
+            Validation.validation_timestamp: datetime.now().isoformat(),
+            Validation.expressions_added: json.dumps(trace.expressions_added),
+            Validation.inference_result: trace.inference_result,
+        }
     )
 
     return GenerateAndValidateResult(annotation=annotation, validation=validation)
@@ -656,27 +733,10 @@ def _recover_last_attempt() -> tuple[str, str, int | None, int | None]:
     return ("", "", None, None)
 
 
-async def _generate_expressions_async(
-    agent: Agent[ExpressionDeps, AgentExpressionOutput],
-    premise: str,
-    hypothesis: str,
-    label: RelationKind,
-    annotation_model: str,
+def _expressions_from_result(
+    result: AgentRunResult[AgentExpressionOutput], premise: str, hypothesis: str
 ) -> tuple[str, str, int | None, int | None]:
-    """
-    Async helper to generate MeTTa expressions via Pydantic AI agent.
-    Returns (last_metta_premise, last_metta_hypothesis, input_tokens, output_tokens)
-    """
-    deps = ExpressionDeps(premise=premise, hypothesis=hypothesis, label=label)
-    prompt = "Generate MeTTa expressions for the premise and hypothesis."
-
-    logger.info("Generating MeTTa expressions", model=annotation_model)
-    try:
-        result = await agent.run(prompt, deps=deps, model=annotation_model)
-    except Exception as e:
-        logger.error("Pydantic AI generation failed", error=str(e))
-        return _recover_last_attempt()
-
+    """Unpack an agent run into (metta_premise, metta_hypothesis, input_tokens, output_tokens)."""
     if not result.output:
         logger.error("Failed to generate MeTTa expressions")
         return ("", "", None, None)
@@ -709,7 +769,12 @@ async def _generate_expressions_async(
     )
 
 
-def _generate_expressions_sync(
+# Both expressions come back in one structured output, so each row costs a
+# single agent run rather than one per sentence.
+_GENERATION_PROMPT = "Generate MeTTa expressions for the premise and hypothesis."
+
+
+async def _generate_expressions_async(
     agent: Agent[ExpressionDeps, AgentExpressionOutput],
     premise: str,
     hypothesis: str,
@@ -717,49 +782,42 @@ def _generate_expressions_sync(
     annotation_model: str,
 ) -> tuple[str, str, int | None, int | None]:
     """
-    Sync helper to generate MeTTa expressions via Pydantic AI agent.
+    Async helper to generate MeTTa expressions via Pydantic AI agent.
     Returns (last_metta_premise, last_metta_hypothesis, input_tokens, output_tokens)
     """
     deps = ExpressionDeps(premise=premise, hypothesis=hypothesis, label=label)
-    prompt = "Generate MeTTa expressions for the premise and hypothesis."
 
     logger.info("Generating MeTTa expressions", model=annotation_model)
     try:
-        result = agent.run_sync(prompt, deps=deps, model=annotation_model)
+        result = await agent.run(_GENERATION_PROMPT, deps=deps, model=annotation_model)
     except Exception as e:
         logger.error("Pydantic AI generation failed", error=str(e))
         return _recover_last_attempt()
 
-    if not result.output:
-        logger.error("Failed to generate MeTTa expressions")
-        return ("", "", None, None)
+    return _expressions_from_result(result, premise, hypothesis)
 
-    output = result.output
-    last_metta_premise = output.metta_premise.strip()
-    last_metta_hypothesis = output.metta_hypothesis.strip()
 
-    if not last_metta_premise or not last_metta_hypothesis:
-        logger.error("Empty expressions in agent output")
-        return ("", "", None, None)
-
-    logger.info(
-        "Generated MeTTa expressions",
-        premise=premise,
-        hypothesis=hypothesis,
-        metta_premise=last_metta_premise,
-        metta_hypothesis=last_metta_hypothesis,
-    )
+def _generate_expressions_sync(
+    agent: Agent[ExpressionDeps, AgentExpressionOutput],
+    premise: str,
+    hypothesis: str,
+    label: RelationKind,
+    annotation_model: str,
+) -> tuple[str, str, int | None, int | None]:
+    """
+    Sync helper to generate MeTTa expressions via Pydantic AI agent.
+    Returns (last_metta_premise, last_metta_hypothesis, input_tokens, output_tokens)
+    """
+    deps = ExpressionDeps(premise=premise, hypothesis=hypothesis, label=label)
 
-    usage = result.usage()
-    input_tokens = getattr(usage, "input_tokens", None)
-    output_tokens = getattr(usage, "output_tokens", None)
+    logger.info("Generating MeTTa expressions", model=annotation_model)
+    try:
+        result = agent.run_sync(_GENERATION_PROMPT, deps=deps, model=annotation_model)
+    except Exception as e:
+        logger.error("Pydantic AI generation failed", error=str(e))
+        return _recover_last_attempt()
 
-    return (
-        last_metta_premise,
-        last_metta_hypothesis,
-        input_tokens,
-        output_tokens,
-    )
+    return _expressions_from_result(result, premise, hypothesis)
 
 
 def generate_and_validate(
@@ -768,17 +826,24 @@ def generate_and_validate(
     label: RelationKind,
     index: int,
     annotation_model: str,
+    agent: Agent[ExpressionDeps, AgentExpressionOutput] | None = None,
+    system_prompt: str | None = None,
 ) -> GenerateAndValidateResult:
     """
     Generate MeTTa expressions for premise and hypothesis, validate them,
     and retry with additional context if validation fails.
 
+    Pass a shared ``agent`` (created from ``system_prompt``) when processing
+    many rows; otherwise a fresh agent is created for this call.
+
     Returns:
         GenerateAndValidateResult containing annotation and validation data
     """
     annotation_id = str(uuid4())
-    system_prompt = ANNOTATION_GUIDELINE_PATH.read_text()
-    agent = _create_metta_agent(system_prompt, annotation_model)
+    if system_prompt is None:
+        system_prompt = read_text_cached(ANNOTATION_GUIDELINE_PATH)
+    if agent is None:
+        agent = _create_metta_agent(system_prompt, annotation_model)
 
     (
         last_metta_premise,
@@ -811,47 +876,81 @@ async def generate_and_validate_async(
     label: RelationKind,
     index: int,
     annotation_model: str,
+    agent: Agent[ExpressionDeps, AgentExpressionOutput] | None = None,
+    system_prompt: str | None = None,
+    candidates: int = 1,
 ) -> GenerateAndValidateResult:
     """
     Async version: Generate MeTTa expressions for premise and hypothesis, validate them,
     and retry with additional context if validation fails.
 
+    Pass a shared ``agent`` (created from ``system_prompt``) when processing
+    many rows so they reuse one HTTP connection pool; otherwise a fresh agent
+    is created for this call.
+
+    With ``candidates`` > 1, that many generations run concurrently and the
+    first one that passes MeTTa validation is kept (falling back to the first
+    usable one). Token counts cover every candidate, since all were paid for.
+
     Returns:
         GenerateAndValidateResult containing annotation and validation data
     """
     annotation_id = str(uuid4())
-    system_prompt = ANNOTATION_GUIDELINE_PATH.read_text()
-    agent = _create_metta_agent(system_prompt, annotation_model)
-
-    (
-        last_metta_premise,
-        last_metta_hypothesis,
-        input_tokens,
-        output_tokens,
-    ) = await _generate_expressions_async(
-        agent, premise, hypothesis, label, annotation_model
+    if system_prompt is None:
+        system_prompt = read_text_cached(ANNOTATION_GUIDELINE_PATH)
+    if agent is None:
+        agent = _create_metta_agent(system_prompt, annotation_model)
+
+    generations = await asyncio.gather(
+        *(
+            _generate_expressions_async(
+                agent, premise, hypothesis, label, annotation_model
+            )
+            for _ in range(max(candidates, 1))
+        )
     )
-
-    if not last_metta_premise or not last_metta_hypothesis:
+    usable = [(p, h) for p, h, _, _ in generations if p and h]
+    if not usable:
         return GenerateAndValidateResult(annotation=None, validation=None)
 
-    return _create_annotation_and_validation(
-        annotation_id=annotation_id,
-        index=index,
-        premise=premise,
-        hypothesis=hypothesis,
-        label=label,
-        last_metta_premise=last_metta_premise,
-        last_metta_hypothesis=last_metta_hypothesis,
-        annotation_model=annotation_model,
-        system_prompt=system_prompt,
-        input_tokens=input_tokens,
-        output_tokens=output_tokens,
-    )
+    input_tokens = _total_tokens(g[2] for g in generations)
+    output_tokens = _total_tokens(g[3] for g in generations)
+
+    result = GenerateAndValidateResult(annotation=None, validation=None)
+    for last_metta_premise, last_metta_hypothesis in usable:
+        # MeTTa validation blocks (it joins a worker thread with a timeout), so
+        # run it off the event loop to keep other rows' model calls in flight.
+        candidate = await asyncio.to_thread(
+            _create_annotation_and_validation,
+            annotation_id=annotation_id,
+            index=index,
+            premise=premise,
+            hypothesis=hypothesis,
+            label=label,
+            last_metta_premise=last_metta_premise,
+            last_metta_hypothesis=last_metta_hypothesis,
+            annotation_model=annotation_model,
+            system_prompt=system_prompt,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        )
+        if result.annotation is None:
+            result = candidate
+        if candidate.validation is not None and candidate.validation.item(
+            0, str(Validation.is_valid)
+        ):
+            return candidate
+    return result
+
+
+def _total_tokens(counts: Iterable[int | None]) -> int | None:
+    """Sum the reported token counts, or None when no candidate reported any."""
+    reported = [count for count in counts if count is not None]
+    return sum(reported) if reported else None
 
 
 def process_in_batches(
-    rows: list[dict],
+    rows: Iterable[dict],
     process_fn: Fn[dict, GenerateAndValidateResult],
     subset_size: int,
     batch_size: int,
@@ -861,7 +960,7 @@ def process_in_batches(
     Process rows in batches with progress tracking.
 
     Args:
-        rows: List of row dictionaries to process
+        rows: Row dictionaries to process; any iterable, consumed lazily
         process_fn: Function to apply to each row
         subset_size: Maximum number of rows to process
         batch_size: Number of rows to process in each batch
@@ -870,70 +969,97 @@ def process_in_batches(
     Returns:
         List of processed row dictionaries
     """
-    # Limit to subset_size
-    rows_to_process = rows[:subset_size]
-    processed_rows: Sequence[GenerateAndValidateResult] = []
+    batches, total = _batched_rows(rows, subset_size, batch_size)
+    processed_rows: list[GenerateAndValidateResult] = []
 
     # Process in batches with tqdm
-    for i in tqdm(
-        range(0, len(rows_to_process), batch_size),
-        desc=description,
-        unit="batch",
-        total=(len(rows_to_process) + batch_size - 1) // batch_size,
-    ):
-        batch = rows_to_process[i : min(subset_size, i + batch_size)]
+    for batch in tqdm(batches, desc=description, unit="batch", total=total):
         batch_results = [process_fn(row) for row in batch]
         processed_rows.extend(batch_results)
 
     return processed_rows
 
 
+def _batched_rows(
+    rows: Iterable[dict], subset_size: int, batch_size: int
+) -> tuple[Iterator[tuple[dict, ...]], int | None]:
+    """Split the first ``subset_size`` rows into batches, with the batch count when known."""
+    total = None
+    if isinstance(rows, Sized):
+        total = -(-min(len(rows), subset_size) // batch_size)
+    return batched(islice(rows, subset_size), batch_size), total
+
+
 async def process_in_batches_async(
-    rows: list[dict],
+    rows: Iterable[dict],
     process_fn_async,  # Async function that takes a dict and returns GenerateAndValidateResult
     subset_size: int,
     batch_size: int,
     description: str = "Processing",
     on_batch_complete: Callable[[Sequence[GenerateAndValidateResult]], None]
     | None = None,
+    max_concurrency: int | None = None,
 ) -> Sequence[GenerateAndValidateResult]:
     """
     Process rows in batches asynchronously with progress tracking.
     Each batch is processed concurrently, with all items in a batch executing in parallel.
 
+    ``on_batch_complete`` runs in a worker thread while the next batch is
+    generating, so persisting batch N overlaps with model calls for batch
+    N+1. Callbacks still run one at a time and in batch order.
+
     Args:
-        rows: List of row dictionaries to process
+        rows: Row dictionaries to process; any iterable, consumed lazily
         process_fn_async: Async function to apply to each row
         subset_size: Maximum number of rows to process
         batch_size: Number of rows to process concurrently in each batch
         description: Description for the progress bar
         on_batch_complete: Optional callback invoked after each batch with its results.
+        max_concurrency: Optional cap on rows in flight at once within a batch.
+
+    A row whose processing raises is logged and recorded as an empty
+    ``GenerateAndValidateResult`` instead of failing the whole batch.
 
     Returns:
         List of processed results
     """
-    # Limit to subset_size
-    rows_to_process = rows[:subset_size]
+    batches, total = _batched_rows(rows, subset_size, batch_size)
     processed_rows: list[GenerateAndValidateResult] = []
+    pending_callback: asyncio.Task[None] | None = None
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
 
-    # Process in batches with tqdm
-    for i in tqdm(
-        range(0, len(rows_to_process), batch_size),
-        desc=description,
-        unit="batch",
-        total=(len(rows_to_process) + batch_size - 1) // batch_size,
-    ):
-        batch = rows_to_process[i : min(subset_size, i + batch_size)]
+    async def process_row(row: dict) -> GenerateAndValidateResult:
+        if semaphore is None:
+            return await process_fn_async(row)
+        async with semaphore:
+            return await process_fn_async(row)
 
-        # Create async tasks for all items in the batch
-        tasks = [process_fn_async(row) for row in batch]
+    # Process in batches with tqdm
+    for batch in tqdm(batches, desc=description, unit="batch", total=total):
+        # Execute all rows in the batch concurrently, bounded by the semaphore
+        outcomes = await asyncio.gather(
+            *(process_row(row) for row in batch), return_exceptions=True
+        )
 
-        # Execute all tasks in the batch concurrently
-        batch_results = await asyncio.gather(*tasks)
+        batch_results: list[GenerateAndValidateResult] = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error("Row processing failed", error=str(outcome))
+                outcome = GenerateAndValidateResult(annotation=None, validation=None)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            batch_results.append(outcome)
         processed_rows.extend(batch_results)
 
         if on_batch_complete is not None:
-            on_batch_complete(batch_results)
+            if pending_callback is not None:
+                await pending_callback
+            pending_callback = asyncio.create_task(
+                asyncio.to_thread(on_batch_complete, batch_results)
+            )
+
+    if pending_callback is not None:
+        await pending_callback
 
     return processed_rows
 
@@ -946,25 +1072,44 @@ _MODEL_PRICING: dict[str, tuple[float, float]] = {
 }
 
 
-def _log_batch_cost_summary(
-    results: Sequence[GenerateAndValidateResult],
-    model: str,
-) -> None:
-    """Aggregate token usage from results and log estimated cost."""
-    total_input = sum(
-        r.annotation.select("input_tokens").item(0, 0)
-        for r in results
-        if r.annotation is not None
-        and "input_tokens" in r.annotation.columns
-        and r.annotation.select("input_tokens").item(0, 0) is not None
-    )
-    total_output = sum(
-        r.annotation.select("output_tokens").item(0, 0)
-        for r in results
-        if r.annotation is not None
-        and "output_tokens" in r.annotation.columns
-        and r.annotation.select("output_tokens").item(0, 0) is not None
+class BatchFrames(NamedTuple):
+    """Annotation and validation rows of a batch, stacked column-wise."""
+
+    annotations: pl.DataFrame
+    validations: pl.DataFrame
+
+
+def _stack_results(results: Sequence[GenerateAndValidateResult]) -> BatchFrames:
+    """Concatenate per-row result frames into one validated frame per table."""
+    annotations = [r.annotation for r in results if r.annotation is not None]
+    validations = [r.validation for r in results if r.validation is not None]
+    # Single-row frames can disagree on dtypes (e.g. all-null token counts),
+    # so they are aligned diagonally here; the validated result is conformed
+    # to the model's column order so whole batches stack vertically.
+    return BatchFrames(
+        annotations=(
+            conform_to_model(
+                Annotation.validate(pl.concat(annotations, how="diagonal_relaxed")),
+                Annotation,
+            )
+            if annotations
+            else pl.DataFrame(schema=schema_dtypes(Annotation))
+        ),
+        validations=(
+            conform_to_model(
+                Validation.validate(pl.concat(validations, how="diagonal_relaxed")),
+                Validation,
+            )
+            if validations
+            else pl.DataFrame(schema=schema_dtypes(Validation))
+        ),
     )
+
+
+def _log_batch_cost_summary(annotations: pl.DataFrame, model: str) -> None:
+    """Aggregate token usage from stacked annotations and log estimated cost."""
+    total_input = annotations["input_tokens"].sum() or 0
+    total_output = annotations["output_tokens"].sum() or 0
     if total_input == 0 and total_output == 0:
         return
 
@@ -1038,10 +1183,62 @@ async def generate_and_store_lightweight(
     }
 
 
+def _parquet_export_is_current() -> bool:
+    """Whether the annotations parquet was written after SQLite last changed.
+
+    A run with ``--no-export-parquet`` writes SQLite only, leaving the
+    parquet older than the database (or its write-ahead log).
+    """
+    try:
+        exported_at = ANNOTATIONS_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    db_files = (ANNOTATIONS_DB_PATH, Path(f"{ANNOTATIONS_DB_PATH}-wal"))
+    return all(
+        exported_at >= path.stat().st_mtime_ns for path in db_files if path.exists()
+    )
+
+
+def _select_unannotated(
+    training_data: pl.LazyFrame,
+    cached_annotations: pl.DataFrame,
+    annotation_model: str,
+) -> pl.LazyFrame:
+    """Rows of ``training_data`` that still need an annotation from this model.
+
+    Rows whose index is already annotated are dropped. SNLI repeats some
+    pairs under other indices; a repeat with the same label is skipped
+    rather than regenerated when ``annotation_model`` already annotated it,
+    and only its first occurrence is kept within this run. A repeat under
+    another label, or annotated only by another model, is still generated.
+    """
+    row_key = [_PREMISE_COL, _HYPOTHESIS_COL, _LABEL_COL]
+    annotated_by_model = (
+        cached_annotations.lazy()
+        .filter(pl.col(str(Annotation.generation_model)) == annotation_model)
+        .select(
+            _PREMISE_COL,
+            _HYPOTHESIS_COL,
+            # Stored labels are strings; unknown ones become null and never match
+            pl.col(_LABEL_COL).cast(RELATION_KIND_DTYPE, strict=False),
+        )
+    )
+    return (
+        training_data.join(
+            cached_annotations.lazy().select(_INDEX_COL),
+            on=_INDEX_COL,
+            how="anti",
+            maintain_order="left",
+        )
+        .join(annotated_by_model, on=row_key, how="anti", maintain_order="left")
+        .unique(subset=row_key, keep="first", maintain_order=True)
+    )
+
+
 @asset(required_resource_keys={"pipeline_config"})
 def data_annotations(
     context,
-    preprocessed_training_data: pl.DataFrame,
+    preprocessed_training_data: pl.LazyFrame,
     cached_annotations: pl.DataFrame,
     cached_validations: pl.DataFrame,
 ) -> tuple[pl.DataFrame, pl.DataFrame]:
@@ -1055,31 +1252,28 @@ def data_annotations(
 
     logger.info("Starting data annotation", pipeline_config=pipeline_config)
 
-    # Get unannotated rows, optionally starting from an offset index
-    unannotated_data_points = preprocessed_training_data.filter(
-        ~pl.col(str(Annotation.index)).is_in(cached_annotations[str(Annotation.index)])
+    # Get unannotated rows. raw_training_data already starts its scan at the
+    # run's offset (passed through its run_config), so it is not reapplied.
+    unannotated_data_points = _select_unannotated(
+        preprocessed_training_data,
+        cached_annotations,
+        pipeline_config.annotation_model,
     )
-    if pipeline_config.offset > 0:
-        unannotated_data_points = unannotated_data_points.filter(
-            pl.col(str(Annotation.index)) >= pipeline_config.offset
-        )
 
-    # Extract premise, hypothesis, and label columns with index
-    dataset_to_annotate = unannotated_data_points.select(
-        [
-            pl.col(str(Annotation.index)),
-            pl.col(str(TrainingData.premise)),
-            pl.col(str(TrainingData.hypothesis)),
-            pl.col(str(TrainingData.label)),
-        ]
+    # One agent (and retrying HTTP client) shared by all concurrent rows
+    system_prompt = read_text_cached(ANNOTATION_GUIDELINE_PATH)
+    agent = _create_metta_agent(
+        system_prompt,
+        pipeline_config.annotation_model,
+        max_output_tokens=pipeline_config.max_output_tokens,
     )
 
     # Apply generate_and_validate to all rows
     async def process_row_async(row: dict) -> GenerateAndValidateResult:
-        premise = row[str(TrainingData.premise)]
-        hypothesis = row[str(TrainingData.hypothesis)]
-        label = row[str(TrainingData.label)]
-        index = row["index"]
+        premise = row[_PREMISE_COL]
+        hypothesis = row[_HYPOTHESIS_COL]
+        label = row[_LABEL_COL]
+        index = row[_INDEX_COL]
 
         return await generate_and_validate_async(
             premise=premise,
@@ -1087,24 +1281,35 @@ def data_annotations(
             label=label,
             index=index,
             annotation_model=pipeline_config.annotation_model,
+            agent=agent,
+            system_prompt=system_prompt,
+            candidates=pipeline_config.annotation_candidates,
         )
 
-    rows = dataset_to_annotate.to_dicts()
+    # Only the rows this run can process are read and turned into Python dicts
+    rows = (
+        unannotated_data_points.head(pipeline_config.subset_size)
+        .collect(engine="streaming")
+        .iter_rows(named=True)
+    )
 
     # Persist each batch to SQLite immediately so no work is lost
     annotation_store = AnnotationStore(ANNOTATIONS_DB_PATH)
+    persisted_batches: list[BatchFrames] = []
 
     def _persist_batch(batch_results: Sequence[GenerateAndValidateResult]) -> None:
-        for result in batch_results:
-            if result.annotation is not None:
-                for row in result.annotation.to_dicts():
-                    annotation_store.insert_annotation(row)
-            if result.validation is not None:
-                for row in result.validation.to_dicts():
-                    annotation_store.insert_validation(row)
-
-    # Run async batch processing
-    processed_results = asyncio.run(
+        batch = _stack_results(batch_results)
+        annotation_store.insert_annotations(batch.annotations)
+        annotation_store.insert_validations(batch.validations)
+        persisted_batches.append(batch)
+        logger.info(
+            "Persisted batch",
+            annotations=len(batch.annotations),
+            validations=len(batch.validations),
+        )
+
+    # Run async batch processing; results are kept via the persisted batches
+    asyncio.run(
         process_in_batches_async(
             rows=rows,
             process_fn_async=process_row_async,
@@ -1112,20 +1317,62 @@ def data_annotations(
             batch_size=pipeline_config.batch_size,
             description="Generating MeTTa annotations",
             on_batch_complete=_persist_batch,
+            max_concurrency=pipeline_config.max_concurrent_annotations,
         )
     )
 
+    new_annotations = pl.concat(
+        [
+            pl.DataFrame(schema=schema_dtypes(Annotation)),
+            *(batch.annotations for batch in persisted_batches),
+        ],
+        how="vertical",
+    )
+
     # Log cost summary for OpenAI models
-    _log_batch_cost_summary(processed_results, pipeline_config.annotation_model)
+    _log_batch_cost_summary(new_annotations, pipeline_config.annotation_model)
 
-    # Reload from SQLite (includes both cached + newly persisted)
-    all_annotations = annotation_store.to_polars("annotations")
-    all_validations = annotation_store.to_polars("validations")
+    if new_annotations.is_empty() and (
+        not pipeline_config.export_parquet or _parquet_export_is_current()
+    ):
+        # Nothing new was written and the parquet snapshot (if wanted) already
+        # reflects SQLite; skip the full rewrite.
+        logger.info("No new annotations; skipping parquet export")
+        return cached_annotations, cached_validations
+
+    # Cached rows plus the batches just persisted, already in columnar form,
+    # instead of reloading and re-converting every row from SQLite. Every
+    # frame is conformed to its model, so these are plain appends.
+    all_annotations = pl.concat(
+        [conform_to_model(cached_annotations, Annotation), new_annotations],
+        how="vertical",
+    )
+    all_validations = pl.concat(
+        [
+            conform_to_model(cached_validations, Validation),
+            *(batch.validations for batch in persisted_batches),
+        ],
+        how="vertical",
+    )
 
-    # Export to parquet for HuggingFace / backward compatibility
-    annotation_store.export_parquet(ANNOTATIONS_PATH, table="annotations")
+    if not pipeline_config.export_parquet:
+        # SQLite already holds every row; the parquet snapshot is a full
+        # rewrite, so it can be produced on demand instead of per run.
+        logger.info("Parquet export disabled; annotations are in SQLite only")
+        return all_annotations, all_validations
+
+    # Export to parquet for HuggingFace / backward compatibility. Both sinks
+    # run in one streaming collect so the files are written concurrently.
+    # The streaming engine sizes its own morsels; streaming_chunk_size (an
+    # old-engine knob) made no measurable difference here, so it is left unset.
+    sinks = [
+        all_annotations.lazy().sink_parquet(ANNOTATIONS_PATH, mkdir=True, lazy=True)
+    ]
     if not all_validations.is_empty():
-        annotation_store.export_parquet(VALIDATIONS_PATH, table="validations")
+        sinks.append(
+            all_validations.lazy().sink_parquet(VALIDATIONS_PATH, mkdir=True, lazy=True)
+        )
+    pl.collect_all(sinks, engine="streaming")
 
     logger.info(
         "Completed data annotation",
@@ -2,7 +2,9 @@
 
 import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
+from functools import cache
 from typing import NamedTuple
 
 import polars as pl
@@ -34,6 +36,28 @@ from metta_nl_corpus.services.defs.transformation.assets import data_annotations
 logger = get_logger(__name__)
 
 
+@cache
+def _materialize_pool() -> ThreadPoolExecutor:
+    """Pool shared by every PipelineExecutor, created on first use.
+
+    The MCP server creates one executor per call, so concurrent
+    materializations are bounded process-wide rather than per instance.
+    """
+    return ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 1, thread_name_prefix="materialize"
+    )
+
+
+def shutdown_materialize_pool() -> None:
+    """Wait for running materializations and release the shared pool.
+
+    A no-op if no pipeline ran; a later run creates a fresh pool.
+    """
+    if _materialize_pool.cache_info().currsize:
+        _materialize_pool().shutdown(wait=True)
+        _materialize_pool.cache_clear()
+
+
 class ExecutionStatus(StrEnum):
     SUCCESS = "success"
     FAILED = "failed"
@@ -99,14 +123,21 @@ class PipelineExecutor:
             logger.info("Materializing pipeline assets")
 
             # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
-                None,
+                _materialize_pool(),
                 lambda: materialize(
                     assets,
                     instance=self.instance,
                     raise_on_error=False,
                     resources={"pipeline_config": pipeline_config},
+                    run_config={
+                        "ops": {
+                            "raw_training_data": {
+                                "config": {"offset": pipeline_config.offset}
+                            }
+                        }
+                    },
                 ),
             )
 
@@ -169,9 +200,9 @@ class PipelineExecutor:
         assets = [bronze_dataset, cleaned_annotations]
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
-                None,
+                _materialize_pool(),
                 lambda: materialize(
                     assets,
                     instance=self.instance,
@@ -200,8 +231,13 @@ class PipelineExecutor:
             if result.success:
                 annotations_count: int = 0
                 try:
-                    df = pl.read_parquet(CLEANED_ANNOTATIONS_PATH)
-                    annotations_count = len(df)
+                    # Row count comes from the parquet footer; no columns are read
+                    annotations_count = (
+                        pl.scan_parquet(CLEANED_ANNOTATIONS_PATH)
+                        .select(pl.len())
+                        .collect()
+                        .item()
+                    )
                 except Exception:
                     pass
 
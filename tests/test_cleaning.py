@@ -0,0 +1,36 @@
+"""Tests for the vectorized cleaning expressions."""
+
+import polars as pl
+
+from metta_nl_corpus.services.defs.cleaning.assets import (
+    has_bad_syntax,
+    has_bad_syntax_expr,
+    migrate_not_to_is_not,
+    migrate_not_to_is_not_expr,
+)
+
+EXPRESSIONS = [
+    "(human Socrates)",
+    "Here is the MeTTa code",
+    "(not (onHorse a-person))",
+    "((is-not tall) a-man)",
+    "```metta\n(foo bar)\n```",
+    "this is an ENTAILMENT",
+    "(knot tied)",
+]
+
+
+def test_has_bad_syntax_expr_matches_scalar() -> None:
+    df = pl.DataFrame({"metta": EXPRESSIONS})
+
+    result = df.select(has_bad_syntax_expr("metta")).to_series().to_list()
+
+    assert result == [has_bad_syntax(e) for e in EXPRESSIONS]
+
+
+def test_migrate_not_to_is_not_expr_matches_scalar() -> None:
+    df = pl.DataFrame({"metta": EXPRESSIONS})
+
+    result = df.select(migrate_not_to_is_not_expr("metta")).to_series().to_list()
+
+    assert result == [migrate_not_to_is_not(e) for e in EXPRESSIONS]
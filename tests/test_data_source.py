@@ -0,0 +1,80 @@
+"""Tests for metta_nl_corpus.lib.data_source."""
+
+import polars as pl
+import pytest
+
+from metta_nl_corpus.lib import data_source
+from metta_nl_corpus.lib.storage import AnnotationStore
+
+
+def test_yield_unannotated_pairs_skips_stored_and_repeated_pairs(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    snli = pl.LazyFrame(
+        {
+            "premise": ["A dog runs.", "A dog runs.", "A cat naps.", "A dog runs."],
+            "hypothesis": [
+                "An animal moves.",
+                "A dog sleeps.",
+                "A cat rests.",
+                "An animal moves.",
+            ],
+            "label": [0, 2, 0, 0],
+        }
+    )
+    monkeypatch.setattr(data_source, "_scan_snli", lambda: snli)
+    store = AnnotationStore(db_path=tmp_path / "test.db")
+    store.insert_annotation(
+        {
+            "annotation_id": "stored",
+            "idx": 2,
+            "label": "entailment",
+            "premise": "A cat naps.",
+            "hypothesis": "A cat rests.",
+            "metta_premise": "(naps cat)",
+            "metta_hypothesis": "(rests cat)",
+            "generation_model": "test",
+            "system_prompt": "test",
+            "version": "0.0.1",
+        }
+    )
+
+    pairs = data_source.yield_unannotated_pairs(store, limit=10, offset=0)
+
+    assert [(p.snli_index, p.hypothesis) for p in pairs] == [
+        (0, "An animal moves."),
+        (1, "A dog sleeps."),
+    ]
+
+
+def test_yield_unannotated_pairs_applies_limit_after_skipping_stored(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    snli = pl.LazyFrame(
+        {
+            "premise": ["P0", "P1", "P2", "P3", "P4"],
+            "hypothesis": ["H0", "H1", "H2", "H3", "H4"],
+            "label": [0, 1, 2, 0, -1],
+        }
+    )
+    monkeypatch.setattr(data_source, "_scan_snli", lambda: snli)
+    store = AnnotationStore(db_path=tmp_path / "test.db")
+    for idx in (1, 2):
+        store.insert_annotation(
+            {
+                "annotation_id": f"stored-{idx}",
+                "idx": idx,
+                "label": "entailment",
+                "premise": f"P{idx}",
+                "hypothesis": f"H{idx}",
+                "metta_premise": "(p)",
+                "metta_hypothesis": "(h)",
+                "generation_model": "test",
+                "system_prompt": "test",
+                "version": "0.0.1",
+            }
+        )
+
+    pairs = data_source.yield_unannotated_pairs(store, limit=1, offset=1)
+
+    assert [(p.snli_index, p.premise) for p in pairs] == [(3, "P3")]
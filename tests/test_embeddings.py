@@ -0,0 +1,20 @@
+"""Tests for metta_nl_corpus.lib.embeddings."""
+
+import numpy as np
+
+from metta_nl_corpus.lib.embeddings import _top_k_indices
+
+
+def test_top_k_indices_matches_full_sort() -> None:
+    scores = np.random.default_rng(0).random(1_000)
+
+    expected = np.argsort(scores)[::-1][:10]
+    assert _top_k_indices(scores, 10).tolist() == expected.tolist()
+
+
+def test_top_k_indices_caps_at_corpus_size() -> None:
+    scores = np.array([0.2, 0.9, 0.5])
+
+    assert _top_k_indices(scores, 10).tolist() == [1, 2, 0]
+    assert _top_k_indices(scores, 0).tolist() == []
+    assert _top_k_indices(np.array([]), 5).tolist() == []
@@ -0,0 +1,86 @@
+"""Tests for metta_nl_corpus.lib.helpers."""
+
+import os
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from metta_nl_corpus.lib.helpers import (
+    Box,
+    OnData,
+    read_text_cached,
+    str_index,
+    str_index_expr,
+)
+from metta_nl_corpus.models import RELATION_KIND_DTYPE, RelationKind
+
+
+def test_str_index_returns_member_at_position() -> None:
+    assert str_index(RelationKind)(2) == RelationKind.CONTRADICTION
+
+
+def test_str_index_coalesces_out_of_range() -> None:
+    label_fn = str_index(RelationKind, RelationKind.NO_LABEL)
+    assert label_fn(-1) == RelationKind.NO_LABEL
+    assert label_fn(99) == RelationKind.NO_LABEL
+
+
+def test_str_index_raises_without_coalesce() -> None:
+    with pytest.raises(IndexError):
+        str_index(RelationKind)(-1)
+
+
+def test_str_index_expr_matches_str_index() -> None:
+    labels = [0, 1, 2, -1]
+    df = pl.DataFrame({"label": labels}).with_columns(
+        str_index_expr("label", RelationKind, RelationKind.NO_LABEL)
+    )
+    label_fn = str_index(RelationKind, RelationKind.NO_LABEL)
+
+    assert df["label"].dtype == pl.String
+    assert df["label"].to_list() == [str(label_fn(n)) for n in labels]
+
+
+def test_box_pipe_matches_or_chain() -> None:
+    double = OnData(lambda df: df * 2)
+    increment = OnData(lambda df: df + 1)
+    box = Box(pl.DataFrame({"x": [1, 2]}))
+
+    assert box.pipe(double, increment).data.equals((box | double | increment).data)
+
+
+def test_str_index_expr_casts_to_relation_kind_enum() -> None:
+    df = pl.DataFrame({"label": [0, 2, -1]}).with_columns(
+        str_index_expr(
+            "label",
+            RelationKind,
+            RelationKind.NO_LABEL,
+            return_dtype=RELATION_KIND_DTYPE,
+        )
+    )
+
+    assert df["label"].dtype == RELATION_KIND_DTYPE
+    assert df["label"].to_list() == ["entailment", "contradiction", "no_label"]
+
+
+def test_read_text_cached_rereads_after_modification(tmp_path: Path) -> None:
+    path = tmp_path / "guideline.md"
+    path.write_text("v1")
+    assert read_text_cached(path) == "v1"
+
+    path.write_text("v2")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+    assert read_text_cached(path) == "v2"
+
+
+def test_read_text_cached_follows_symlink_switch(tmp_path: Path) -> None:
+    (tmp_path / "v1.md").write_text("v1")
+    (tmp_path / "v2.md").write_text("v2")
+    link = tmp_path / "default.md"
+    link.symlink_to("v1.md")
+    assert read_text_cached(link) == "v1"
+
+    link.unlink()
+    link.symlink_to("v2.md")
+    assert read_text_cached(link) == "v2"
@@ -1,8 +1,10 @@
+import json
 from pathlib import Path
 
 from hyperon import MeTTa
 
 from metta_nl_corpus.services.defs.transformation.assets import (
+    _neutral_trace,
     validate_expressions_are_contradictory,
     validate_expressions_are_entailing,
 )
@@ -483,3 +485,17 @@ def test_proposition_tv_propagates_through_derived_rule():
     # The proposition's strength (0.97) should appear in the combined TV
     # s = 1.0 * 0.97 = 0.97, c = min(0.99, 0.95) = 0.95
     assert "0.97" in tv_str
+
+
+def test_neutral_skips_contradiction_check_when_entailing():
+    trace = _neutral_trace("(white swan)", "(white swan)")
+
+    assert not trace.is_valid
+    assert json.loads(trace.inference_result)["contradiction"] is None
+
+
+def test_unrelated_expressions_are_neutral():
+    trace = _neutral_trace("(white swan)", "(black crow)")
+
+    assert trace.is_valid
+    assert json.loads(trace.inference_result)["contradiction"] is not None
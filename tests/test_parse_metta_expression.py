@@ -240,3 +240,17 @@ And here's another one:
         result = parse_metta_expression(expression)
         expected = "(= (process-data $input)\n   (let $result\n      (transform $input)\n      (validate $result)))"
         assert result == expected
+
+    def test_wraps_bare_lines_and_keeps_indented_expressions(self):
+        """Test bare token lines are wrapped while parenthesized lines are kept."""
+        expression = """```metta
+jumpedOver a-person airplane
+  (nested (a b))
+
+ smiling children \t
+```"""
+        result = parse_metta_expression(expression)
+        expected = (
+            "(jumpedOver a-person airplane)\n  (nested (a b))\n\n(smiling children)"
+        )
+        assert result == expected
@@ -0,0 +1,184 @@
+"""Tests for the async batch driver in the transformation assets."""
+
+import asyncio
+import os
+
+import polars as pl
+import pytest
+
+from metta_nl_corpus.models import RELATION_KIND_DTYPE, RelationKind
+from metta_nl_corpus.services.defs.transformation import assets
+from metta_nl_corpus.services.defs.transformation.assets import (
+    GenerateAndValidateResult,
+    _select_unannotated,
+    _stack_results,
+    generate_and_validate_async,
+    pandera_record,
+    process_in_batches_async,
+)
+
+
+def test_max_concurrency_bounds_rows_in_flight() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def process(row: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return row
+
+    results = asyncio.run(
+        process_in_batches_async(list(range(10)), process, 10, 10, max_concurrency=3)
+    )
+
+    assert list(results) == list(range(10))
+    assert peak == 3
+
+
+def test_failed_row_does_not_abort_batch() -> None:
+    async def process(row: int) -> int:
+        if row == 1:
+            raise RuntimeError("generation failed")
+        return row
+
+    results = asyncio.run(process_in_batches_async([0, 1, 2], process, 3, 3))
+
+    assert results[0] == 0
+    assert results[1] == GenerateAndValidateResult(annotation=None, validation=None)
+    assert results[2] == 2
+
+
+def test_rows_are_consumed_lazily_up_to_subset_size() -> None:
+    consumed: list[int] = []
+
+    def rows():
+        for row in range(100):
+            consumed.append(row)
+            yield row
+
+    async def process(row: int) -> int:
+        return row
+
+    results = asyncio.run(process_in_batches_async(rows(), process, 5, 2))
+
+    assert list(results) == [0, 1, 2, 3, 4]
+    assert consumed == [0, 1, 2, 3, 4]
+
+
+def test_stack_results_validates_the_stacked_batch() -> None:
+    def annotation(annotation_id: str, index: int) -> pl.DataFrame:
+        return pandera_record(
+            {
+                "annotation_id": annotation_id,
+                "index": index,
+                "premise": "A dog runs.",
+                "hypothesis": "An animal moves.",
+                "label": RelationKind.ENTAILMENT,
+                "metta_premise": "(runs dog)",
+                "metta_hypothesis": "(moves animal)",
+                "generation_model": "test",
+                "system_prompt": "test",
+                "version": "0.0.1",
+                "input_tokens": None,
+                "output_tokens": 7,
+            }
+        )
+
+    batch = _stack_results(
+        [
+            GenerateAndValidateResult(annotation=annotation("a", 1), validation=None),
+            GenerateAndValidateResult(annotation=annotation("b", 2), validation=None),
+        ]
+    )
+
+    assert batch.annotations["index"].dtype == pl.UInt32
+    assert batch.annotations["label"].to_list() == ["entailment", "entailment"]
+    assert batch.validations.is_empty()
+
+
+def test_candidates_keep_first_valid_generation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    generations = iter(
+        [
+            ("(white swan)", "(black crow)", 10, 2),  # not entailing
+            ("(white swan)", "(white swan)", 11, 3),  # entailing
+        ]
+    )
+
+    async def generate(*args, **kwargs):
+        return next(generations)
+
+    monkeypatch.setattr(assets, "_generate_expressions_async", generate)
+
+    result = asyncio.run(
+        generate_and_validate_async(
+            premise="A white swan.",
+            hypothesis="A white swan.",
+            label=RelationKind.ENTAILMENT,
+            index=0,
+            annotation_model="test",
+            agent=object(),
+            system_prompt="test",
+            candidates=2,
+        )
+    )
+
+    assert result.annotation is not None and result.validation is not None
+    assert result.annotation.item(0, "metta_hypothesis") == "(white swan)"
+    assert result.validation.item(0, "is_valid")
+    assert result.annotation.item(0, "input_tokens") == 21
+    assert result.annotation.item(0, "output_tokens") == 5
+
+
+def test_select_unannotated_skips_only_same_label_and_model_repeats() -> None:
+    training = pl.LazyFrame(
+        {
+            "index": [0, 1, 2, 3, 4],
+            "premise": ["P", "P", "P", "Q", "P"],
+            "hypothesis": ["H", "H", "H", "H", "H"],
+            "label": ["entailment", "entailment", "neutral", "neutral", "neutral"],
+        },
+        schema_overrides={"index": pl.UInt32, "label": RELATION_KIND_DTYPE},
+    )
+    cached = pl.DataFrame(
+        {
+            "index": [0, 3],
+            "premise": ["P", "Q"],
+            "hypothesis": ["H", "H"],
+            "label": ["entailment", "neutral"],
+            "generation_model": ["model-a", "model-b"],
+        },
+        schema_overrides={"index": pl.UInt32},
+    )
+
+    def selected(model: str) -> list[int]:
+        return _select_unannotated(training, cached, model).collect()["index"].to_list()
+
+    # 1 repeats pair 0 under the same label; 2 repeats it under another label;
+    # 4 repeats 2 within this run. Model-b never annotated pair 0.
+    assert selected("model-a") == [2]
+    assert selected("model-b") == [1, 2]
+
+
+def test_parquet_export_is_stale_after_sqlite_only_run(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    parquet = tmp_path / "annotations.parquet"
+    db = tmp_path / "annotations.db"
+    monkeypatch.setattr(assets, "ANNOTATIONS_PATH", parquet)
+    monkeypatch.setattr(assets, "ANNOTATIONS_DB_PATH", db)
+    db.write_bytes(b"")
+    assert not assets._parquet_export_is_current()
+
+    parquet.write_bytes(b"")
+    os.utime(parquet, ns=(0, db.stat().st_mtime_ns + 1))
+    assert assets._parquet_export_is_current()
+
+    wal = tmp_path / "annotations.db-wal"
+    wal.write_bytes(b"")
+    os.utime(wal, ns=(0, parquet.stat().st_mtime_ns + 1))
+    assert not assets._parquet_export_is_current()
@@ -1,10 +1,20 @@
 """Tests for the Pydantic AI MeTTa expression generation agent."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from metta_nl_corpus.services.defs.transformation import assets
 from metta_nl_corpus.services.defs.transformation.assets import (
     AgentExpressionOutput,
     ExpressionDeps,
     RelationKind,
     _create_metta_agent,
+    _is_transient_http_error,
+    _run_validation_with_trace,
     parse_all_tool,
     validate_relation_tool,
 )
@@ -77,6 +87,14 @@ def test_agent_usage_present():
     assert hasattr(usage, "input_tokens") or hasattr(usage, "requests")
 
 
+def test_agent_caps_output_tokens_when_configured():
+    """max_output_tokens becomes the agent's max_tokens model setting."""
+    assert _create_metta_agent("prompt", "openai:gpt-4o-mini").model_settings is None
+
+    agent = _create_metta_agent("prompt", "openai:gpt-4o-mini", max_output_tokens=256)
+    assert agent.model_settings == {"max_tokens": 256}
+
+
 def test_validate_relation_tool_entailment():
     """validate_relation_tool returns valid=True for entailing expressions."""
     result = validate_relation_tool("(A B)", "(A B)", "entailment")
@@ -91,6 +109,13 @@ def test_validate_relation_tool_invalid_relation():
     assert "Unknown relation" in result["message"]
 
 
+def test_validate_relation_tool_rejects_blank_premise():
+    """A blank side is rejected up front instead of validating as neutral."""
+    result = validate_relation_tool("  ", "(A)", "neutral")
+    assert result["valid"] is False
+    assert "metta_premise is empty" in result["message"]
+
+
 def test_agent_expression_output_valid_entailment():
     """AgentExpressionOutput accepts valid entailing expressions."""
     output = AgentExpressionOutput(
@@ -114,3 +139,51 @@ def test_agent_expression_output_accepts_parseable_expressions():
     )
     assert output.metta_premise == "(A B)"
     assert output.relation == "entailment"
+
+
+def test_only_transient_http_errors_are_retried():
+    """Rate limits, 5xx and connection failures retry; other 4xx do not."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+    def status_error(code: int) -> httpx.HTTPStatusError:
+        response = httpx.Response(code, request=request)
+        return httpx.HTTPStatusError("error", request=request, response=response)
+
+    assert _is_transient_http_error(status_error(429))
+    assert _is_transient_http_error(status_error(503))
+    assert _is_transient_http_error(httpx.ConnectError("refused"))
+    assert _is_transient_http_error(httpx.ReadTimeout("slow"))
+    assert not _is_transient_http_error(status_error(400))
+    assert not _is_transient_http_error(status_error(401))
+
+
+def test_janus_validations_do_not_overlap(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Janus runners share one Prolog database, so validations run one at a time."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    class SharedEngineRunner:
+        def run(self, code: str) -> list[list[str]]:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return [["True"]]
+
+    monkeypatch.setenv("METTA_BACKEND", "janus")
+    monkeypatch.setattr(assets, "create_runner", SharedEngineRunner)
+
+    def validate(_: int) -> bool:
+        return _run_validation_with_trace(
+            ["!(add-proposition (white swan))"],
+            ANNOTATION_GUIDELINE_PATH,
+            "!(find-evidence-for (white swan))",
+        ).is_valid
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert all(pool.map(validate, range(4)))
+    assert peak == 1
@@ -0,0 +1,97 @@
+"""Tests for MeTTa space file versioning helpers."""
+
+import hashlib
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from metta_nl_corpus.lib import space_versioning
+from metta_nl_corpus.lib.space_versioning import (
+    compute_file_hash,
+    get_git_commit_hash,
+    get_git_commit_hashes,
+)
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    """A throwaway git repo with two space files committed separately."""
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "test")
+    (tmp_path / "a.metta").write_text("(a)")
+    git("add", "a.metta")
+    git("commit", "-qm", "add a")
+    (tmp_path / "b.metta").write_text("(b)")
+    git("add", "b.metta")
+    git("commit", "-qm", "add b")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    space_versioning._GIT_COMMIT_HASHES.clear()
+
+
+def test_compute_file_hash_is_md5(repo: Path) -> None:
+    path = repo / "a.metta"
+    assert compute_file_hash(path) == hashlib.md5(path.read_bytes()).hexdigest()
+
+
+def test_bulk_hashes_match_single_lookups(repo: Path) -> None:
+    paths = [repo / "a.metta", repo / "b.metta"]
+    bulk = get_git_commit_hashes(paths)
+
+    space_versioning._GIT_COMMIT_HASHES.clear()
+    assert bulk == {path: get_git_commit_hash(path) for path in paths}
+    assert bulk[paths[0]] != bulk[paths[1]]
+
+
+def test_untracked_file_has_no_hash(repo: Path) -> None:
+    untracked = repo / "c.metta"
+    untracked.write_text("(c)")
+    assert get_git_commit_hashes([untracked]) == {untracked: None}
+
+
+def test_edited_file_is_looked_up_again(repo: Path) -> None:
+    path = repo / "a.metta"
+    before = get_git_commit_hash(path)
+
+    path.write_text("(a edited)")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    subprocess.run(
+        ["git", "commit", "-qam", "edit a"], cwd=repo, check=True, capture_output=True
+    )
+
+    assert get_git_commit_hash(path) != before
+    assert get_git_commit_hashes([path])[path] == get_git_commit_hash(path)
+
+
+def test_commit_after_lookup_is_picked_up(repo: Path) -> None:
+    path = repo / "a.metta"
+    path.write_text("(a edited)")
+    before = get_git_commit_hash(path)
+    assert get_git_commit_hashes([path]) == {path: before}
+
+    # Committing moves HEAD but leaves the file's mtime untouched
+    subprocess.run(
+        ["git", "commit", "-qam", "edit a"], cwd=repo, check=True, capture_output=True
+    )
+    head = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+    assert head != before
+    assert get_git_commit_hash(path) == head
+    assert get_git_commit_hashes([path]) == {path: head}
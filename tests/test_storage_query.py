@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 
+import polars as pl
 import pytest
 
-from metta_nl_corpus.lib.storage import AnnotationStore
+from metta_nl_corpus.lib.storage import (
+    AnnotationStore,
+    conform_to_model,
+    schema_dtypes,
+)
+from metta_nl_corpus.models import Annotation
 
 
 @pytest.fixture()
@@ -174,3 +180,65 @@ class TestUpsertAnnotation:
         # Original fields preserved
         assert row["premise"] == "P"
         assert row["hypothesis"] == "H"
+
+
+class TestBulkInsert:
+    def test_insert_annotations_matches_single_row_inserts(self, tmp_path):
+        rows = [
+            _make_row("id-1", "A", "B", idx=1),
+            _make_row("id-2", "C", "D", idx=2),
+        ]
+        single = AnnotationStore(db_path=tmp_path / "single.db")
+        for row in rows:
+            single.insert_annotation(row)
+        bulk = AnnotationStore(db_path=tmp_path / "bulk.db")
+
+        frame = pl.DataFrame(rows).rename({"idx": "index"})
+        assert bulk.insert_annotations(frame) == 2
+
+        assert bulk.to_polars().equals(single.to_polars())
+
+    def test_insert_annotations_replaces_existing_ids(self, tmp_path):
+        s = AnnotationStore(db_path=tmp_path / "bulk.db")
+        s.insert_annotation(_make_row("id-1", "A", "B"))
+
+        s.insert_annotations(
+            pl.DataFrame([_make_row("id-1", "A", "B", metta_premise="(new)")])
+        )
+
+        assert s.query()["total"] == 1
+        assert s.get_annotation("id-1")["metta_premise"] == "(new)"
+
+    def test_empty_frame_inserts_nothing(self, tmp_path):
+        s = AnnotationStore(db_path=tmp_path / "bulk.db")
+
+        assert s.insert_validations(pl.DataFrame()) == 0
+
+
+class TestEmbeddings:
+    def test_batch_upsert_round_trips_vectors(self, tmp_path):
+        s = AnnotationStore(db_path=tmp_path / "emb.db")
+        s.upsert_embeddings_batch(
+            [
+                ("id-1", "premise", [0.25, -1.5, 3.0], "test"),
+                ("id-2", "premise", [1.0, 0.0, 0.5], "test"),
+            ]
+        )
+
+        ids, vectors = s.load_embeddings(field="premise", model="test")
+
+        assert ids == ["id-1", "id-2"]
+        assert vectors.tolist() == [[0.25, -1.5, 3.0], [1.0, 0.0, 0.5]]
+
+
+class TestConformToModel:
+    def test_orders_columns_and_fills_missing_with_typed_nulls(self):
+        df = pl.DataFrame({"label": ["neutral"], "annotation_id": ["a"]})
+
+        conformed = conform_to_model(df, Annotation)
+
+        assert conformed.schema == pl.Schema(schema_dtypes(Annotation))
+        assert conformed.item(0, "label") == "neutral"
+        assert conformed.item(0, "fix_reason") is None
+        stacked = pl.concat([conformed, conformed], how="vertical")
+        assert stacked.height == 2